@@ -17,7 +17,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QMessageBox,
 )
-from PySide6.QtGui import QPalette, QColor, QPixmap
+from PySide6.QtGui import QPalette, QColor, QPixmap, QPixmapCache
 from PySide6.QtCore import Qt
 from typing import cast
 
@@ -579,6 +579,8 @@ def run_app(argv: Sequence[str] | None = None) -> int:
     app = existing_app or QApplication(list(argv) if argv is not None else sys.argv)
 
     set_dark_theme(cast(QApplication, app))
+    # Leave room for the decoded field background (~25 MB) so canvases can share it
+    QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 64 * 1024))
 
     window = MainWindow()
     window.show()
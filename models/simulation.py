@@ -18,8 +18,11 @@ BLine's simplicity shines.
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from models.path_model import (
     Path,
@@ -46,10 +49,29 @@ class ChassisSpeeds:
 
 @dataclass
 class SimResult:
-    poses_by_time: Dict[float, Tuple[float, float, float]]
     times_sorted: List[float]
     total_time_s: float
     trail_points: List[Tuple[float, float]]  # List of (x, y) positions for the trail
+    # Pose samples as parallel columns, index-aligned with times_sorted
+    pose_x_m: List[float] = field(default_factory=list)
+    pose_y_m: List[float] = field(default_factory=list)
+    pose_theta_rad: List[float] = field(default_factory=list)
+
+    @cached_property
+    def poses_by_time(self) -> Dict[float, Tuple[float, float, float]]:
+        """Poses keyed by sample time, built on first access."""
+        return dict(zip(self.times_sorted, zip(self.pose_x_m, self.pose_y_m, self.pose_theta_rad)))
+
+    def sample_index_at(self, t_s: float) -> int:
+        """Return the index of the latest sample at or before t_s (0 if t_s precedes it)."""
+        return max(0, bisect_right(self.times_sorted, t_s) - 1)
+
+    def pose_at(self, t_s: float) -> Optional[Tuple[float, float, float]]:
+        """Return the latest pose sampled at or before t_s (the first pose if t_s precedes it)."""
+        if not self.times_sorted:
+            return None
+        i = self.sample_index_at(t_s)
+        return (self.pose_x_m[i], self.pose_y_m[i], self.pose_theta_rad[i])
 
 
 def wrap_angle_radians(theta: float) -> float:
@@ -65,14 +87,6 @@ def shortest_angular_distance(target: float, current: float) -> float:
     return delta
 
 
-def dot(ax: float, ay: float, bx: float, by: float) -> float:
-    return ax * bx + ay * by
-
-
-def hypot2(x: float, y: float) -> float:
-    return math.hypot(x, y)
-
-
 def limit_acceleration(
     desired: ChassisSpeeds,
     last: ChassisSpeeds,
@@ -85,10 +99,11 @@ def limit_acceleration(
 
     dvx = desired.vx_mps - last.vx_mps
     dvy = desired.vy_mps - last.vy_mps
-    desired_acc = hypot2(dvx, dvy) / dt
 
-    obtainable_acc = max(0.0, min(desired_acc, float(max_trans_accel_mps2)))
-    theta = math.atan2(dvy, dvx) if (abs(dvx) + abs(dvy)) > 0.0 else 0.0
+    # Scale the velocity change down onto the acceleration circle when it exceeds it
+    dv_mag = math.hypot(dvx, dvy)
+    dv_cap = max(0.0, float(max_trans_accel_mps2) * dt)
+    scale = dv_cap / dv_mag if dv_mag > dv_cap else 1.0
 
     desired_alpha = (desired.omega_radps - last.omega_radps) / dt
     obtainable_alpha = max(
@@ -96,8 +111,8 @@ def limit_acceleration(
     )
 
     return ChassisSpeeds(
-        vx_mps=last.vx_mps + math.cos(theta) * obtainable_acc * dt,
-        vy_mps=last.vy_mps + math.sin(theta) * obtainable_acc * dt,
+        vx_mps=last.vx_mps + dvx * scale,
+        vy_mps=last.vy_mps + dvy * scale,
         omega_radps=last.omega_radps + obtainable_alpha * dt,
     )
 
@@ -306,6 +321,56 @@ def _build_global_rotation_keyframes(
     return dedup
 
 
+def _build_heading_frames(
+    global_frames: List[_GlobalRotationKeyframe], start_heading: float
+) -> List[Tuple[float, float, bool]]:
+    """Return the (s, theta, profiled) heading frames used by the desired heading lookup.
+
+    A frame holding the start heading is prepended when the first rotation event is
+    not at s=0 (or when there are no rotation events at all).
+    """
+    frames: List[Tuple[float, float, bool]] = []
+    if not global_frames or global_frames[0].s_m > 0.0 + 1e-9:
+        frames.append((0.0, start_heading, True))
+    for kf in global_frames:
+        frames.append((kf.s_m, kf.theta_target, kf.profiled_rotation))
+    return frames
+
+
+def _heading_frame_ends(frames: List[Tuple[float, float, bool]]) -> List[float]:
+    """Upper s bound (inclusive, with tolerance) of each bracket between consecutive frames."""
+    return [s1 + 1e-12 for s1, _, _ in frames[1:]]
+
+
+def _desired_heading_from_frames(
+    frames: List[Tuple[float, float, bool]],
+    frame_ends: List[float],
+    s_m: float,
+) -> Tuple[float, float, bool]:
+    """Desired heading lookup over prebuilt frames; see _desired_heading_for_global_s."""
+    # First bracket whose end covers s_m
+    i = bisect_left(frame_ends, s_m)
+    if i >= len(frame_ends):
+        # After the last frame, hold
+        _, th_last, profiled_last = frames[-1]
+        return th_last, 0.0, profiled_last
+
+    s0, th0, _ = frames[i]
+    s1, th1, profiled1 = frames[i + 1]
+    delta = shortest_angular_distance(th1, th0)
+    dtheta_ds = delta / max((s1 - s0), 1e-9)
+    # Before (or exactly at) this keyframe: hold its heading; no pre-snap.
+    if s_m <= s0 + 1e-12:
+        return th0, dtheta_ds, profiled1
+
+    # Within this interval: either interpolate (profiled) or step (non-profiled).
+    if not profiled1:
+        return th1, 0.0, profiled1
+    alpha = (s_m - s0) / max((s1 - s0), 1e-9)
+    desired_theta = wrap_angle_radians(th0 + delta * alpha)
+    return desired_theta, dtheta_ds, profiled1
+
+
 def _desired_heading_for_global_s(
     global_frames: List[_GlobalRotationKeyframe],
     s_m: float,
@@ -323,40 +388,8 @@ def _desired_heading_for_global_s(
 
     Returns (desired_theta, dtheta_ds, profiled_rotation_for_interval).
     """
-    if not global_frames:
-        return start_heading, 0.0, True
-
-    frames: List[Tuple[float, float, bool]] = []
-    if global_frames[0].s_m > 0.0 + 1e-9:
-        frames.append((0.0, start_heading, True))
-    for kf in global_frames:
-        frames.append((kf.s_m, kf.theta_target, kf.profiled_rotation))
-
-    # Iterate across brackets
-    for i in range(len(frames) - 1):
-        s0, th0, profiled0 = frames[i]
-        s1, th1, profiled1 = frames[i + 1]
-        # Before (or exactly at) this keyframe: hold its heading; no pre-snap.
-        if s_m <= s0 + 1e-12:
-            delta = shortest_angular_distance(th1, th0)
-            dtheta_ds = delta / max((s1 - s0), 1e-9)
-            return th0, dtheta_ds, profiled1
-
-        # Within this interval: either interpolate (profiled) or step (non-profiled).
-        if s0 < s_m <= s1 + 1e-12:
-            delta = shortest_angular_distance(th1, th0)
-            dtheta_ds = delta / max((s1 - s0), 1e-9)
-            if not profiled1:
-                return th1, 0.0, profiled1
-            alpha = (s_m - s0) / max((s1 - s0), 1e-9)
-            desired_theta = wrap_angle_radians(th0 + delta * alpha)
-            return desired_theta, dtheta_ds, profiled1
-
-    # After the last frame, hold
-    _, th_last, profiled_last = frames[-1]
-    if not profiled_last:
-        return th_last, 0.0, profiled_last
-    return th_last, 0.0, profiled_last
+    frames = _build_heading_frames(global_frames, start_heading)
+    return _desired_heading_from_frames(frames, _heading_frame_ends(frames), s_m)
 
 
 def _resolve_constraint(value: Optional[float], fallback: Optional[float], default: float) -> float:
@@ -403,9 +436,10 @@ def _get_handoff_radius_for_segment(
     return default_radius
 
 
-def _active_translation_limit(path: Path, key: str, next_anchor_ord: int) -> Optional[float]:
-    """Return the most restrictive translation constraint (minimum value) active
-    for the given next anchor ordinal (1-based). If none match, returns None.
+def _active_ranged_limit(path: Path, key: str, ordinal_1b: int) -> Optional[float]:
+    """Return the most restrictive ranged constraint (minimum value) for `key`
+    whose [start_ordinal, end_ordinal] range contains the given 1-based ordinal.
+    If none match, returns None.
     """
     best: Optional[float] = None
     try:
@@ -417,7 +451,7 @@ def _active_translation_limit(path: Path, key: str, next_anchor_ord: int) -> Opt
                     continue
                 l = int(getattr(rc, "start_ordinal", 1))
                 h = int(getattr(rc, "end_ordinal", 1))
-                if int(l) <= int(next_anchor_ord) <= int(h):
+                if int(l) <= int(ordinal_1b) <= int(h):
                     raw_value = getattr(rc, "value", None)
                     if not isinstance(raw_value, (int, float)):
                         continue
@@ -431,64 +465,195 @@ def _active_translation_limit(path: Path, key: str, next_anchor_ord: int) -> Opt
     return best
 
 
-def _rotation_target_event_ordinal(
-    global_keyframes: List[_GlobalRotationKeyframe], global_s_now: float
-) -> Optional[int]:
-    """Return the 1-based ordinal of the rotation-domain 'current target' event.
+def _build_translation_limit_table(
+    path: Path, key: str, segment_count: int, default: float
+) -> List[float]:
+    """Resolve a translation constraint for every segment up front.
+
+    Segment i ends at anchor ordinal i + 2 (1-based), which is the anchor the
+    ranged constraint ranges refer to.
+    """
+    table: List[float] = []
+    for seg_index in range(segment_count):
+        limit = _active_ranged_limit(path, key, seg_index + 2)
+        table.append(float(limit) if limit is not None else float(default))
+    return table
+
+
+@dataclass
+class _RotationLimitTable:
+    """Piecewise rotation limits (radians) keyed by the current rotation target.
+
+    Entry i holds the limits active while global keyframe i is the rotation
+    'current target' event:
     - Before an event: that event
-    - Exactly at an event: the next event if it exists, otherwise this event
+    - Exactly at an event (within tolerance): the next event if it exists,
+      otherwise this event
     - After the last event: the last event
+
+    Entry i is therefore active on [s_lower[i - 1], s_lower[i]), with the first
+    and last entries extending to -inf and +inf respectively.
     """
-    if not global_keyframes:
-        return None
+
+    s_lower: List[float]  # keyframe s - tolerance, ascending
+    max_omega: List[float]
+    max_alpha: List[float]
+
+    def index_at(self, global_s: float) -> int:
+        return min(bisect_right(self.s_lower, global_s), len(self.max_omega) - 1)
+
+    def bounds(self, index: int) -> Tuple[float, float]:
+        """Return the [lo, hi) range of s over which entry `index` is active."""
+        lo = self.s_lower[index - 1] if index > 0 else -math.inf
+        hi = self.s_lower[index] if index < len(self.max_omega) - 1 else math.inf
+        return lo, hi
+
+
+def _build_rotation_limit_table(
+    path: Path,
+    global_keyframes: List[_GlobalRotationKeyframe],
+    base_max_omega: float,
+    base_max_alpha: float,
+) -> _RotationLimitTable:
+    """Resolve rotation constraints per rotation event, converted to radians once."""
     tol_s = 1e-6
-    n = len(global_keyframes)
+    if not global_keyframes:
+        return _RotationLimitTable([], [float(base_max_omega)], [float(base_max_alpha)])
+
+    s_lower: List[float] = []
+    max_omega: List[float] = []
+    max_alpha: List[float] = []
     for i, kf in enumerate(global_keyframes):
-        if global_s_now < kf.s_m - tol_s:
-            return int(getattr(kf, "event_ordinal_1b", i + 1))
-        if abs(global_s_now - kf.s_m) <= tol_s:
-            # At an event: switch immediately to next if available
-            if i + 1 < n:
-                next_kf = global_keyframes[i + 1]
-                return int(getattr(next_kf, "event_ordinal_1b", i + 2))
-            # No next event; continue using this event
-            return int(getattr(kf, "event_ordinal_1b", i + 1))
-    # After the last event
-    last_kf = global_keyframes[-1]
-    return int(getattr(last_kf, "event_ordinal_1b", len(global_keyframes)))
-
-
-def _active_rotation_limit(
-    path: Path, global_keyframes: List[_GlobalRotationKeyframe], key: str, global_s_now: float
-) -> Optional[float]:
-    """Return the most restrictive rotation constraint (minimum value) for the
-    current rotation target event. If none match, returns None.
+        s_lower.append(kf.s_m - tol_s)
+        event_ord_1b = int(getattr(kf, "event_ordinal_1b", i + 1))
+        omega_eff: Optional[float] = None
+        alpha_eff: Optional[float] = None
+        if event_ord_1b > 0:
+            omega_eff = _active_ranged_limit(path, "max_velocity_deg_per_sec", event_ord_1b)
+            alpha_eff = _active_ranged_limit(path, "max_acceleration_deg_per_sec2", event_ord_1b)
+        max_omega.append(
+            math.radians(float(omega_eff)) if omega_eff is not None else float(base_max_omega)
+        )
+        max_alpha.append(
+            math.radians(float(alpha_eff)) if alpha_eff is not None else float(base_max_alpha)
+        )
+    return _RotationLimitTable(s_lower, max_omega, max_alpha)
+
+
+@dataclass
+class _PathGeometry:
+    """Config-independent path preprocessing, shared by every run over the same path."""
+
+    segments: List[_Segment]
+    anchors: List[Tuple[float, float]]
+    anchor_path_indices: List[int]
+    cumulative_lengths: List[float]
+    total_path_len: float
+    global_keyframes: List[_GlobalRotationKeyframe]
+
+
+def _build_path_geometry(path: Path) -> _PathGeometry:
+    segments, anchors, anchor_path_indices = _build_segments(path)
+
+    total_path_len = 0.0
+    cumulative_lengths: List[float] = [0.0]
+    for seg in segments:
+        L = max(seg.length_m, 0.0)
+        total_path_len += L
+        cumulative_lengths.append(total_path_len)
+
+    # Global rotation keyframes drive rotation event ordinals and desired headings along s
+    global_keyframes: List[_GlobalRotationKeyframe] = []
+    if segments:
+        global_keyframes = _build_global_rotation_keyframes(
+            path, anchor_path_indices, cumulative_lengths
+        )
+
+    return _PathGeometry(
+        segments=segments,
+        anchors=anchors,
+        anchor_path_indices=anchor_path_indices,
+        cumulative_lengths=cumulative_lengths,
+        total_path_len=total_path_len,
+        global_keyframes=global_keyframes,
+    )
+
+
+# Small LRU of recent simulate_path results keyed by the full simulation input. Keys hold
+# the content itself (not identities), so an edited path can never hit a stale entry.
+_SIM_CACHE_MAX_ENTRIES = 8
+_sim_cache: "OrderedDict[Tuple, SimResult]" = OrderedDict()
+
+_CONFIG_KEYS_USED = (
+    "default_max_velocity_meters_per_sec",
+    "default_max_acceleration_meters_per_sec2",
+    "default_max_velocity_deg_per_sec",
+    "default_max_acceleration_deg_per_sec2",
+    "default_intermediate_handoff_radius_meters",
+)
+
+
+def _simulation_signature(path: Path, config: Optional[Dict], dt_s: float) -> Optional[Tuple]:
+    """Build a hashable key covering every input that affects simulate_path.
+
+    Returns None if the inputs cannot be canonicalized, in which case the run is
+    not cached.
     """
-    event_ord_1b = _rotation_target_event_ordinal(global_keyframes, global_s_now)
-    if event_ord_1b is None or event_ord_1b <= 0:
-        return None
-    best: Optional[float] = None
     try:
-        for rc in getattr(path, "ranged_constraints", []) or []:
-            try:
-                if not isinstance(rc, RangedConstraint):
-                    continue
-                if rc.key != key:
-                    continue
-                l = int(getattr(rc, "start_ordinal", 1))
-                h = int(getattr(rc, "end_ordinal", 1))
-                if int(l) <= int(event_ord_1b) <= int(h):
-                    raw_value = getattr(rc, "value", None)
-                    if not isinstance(raw_value, (int, float)):
-                        continue
-                    v = float(raw_value)
-                    if v > 0.0:
-                        best = v if (best is None or v < best) else best
-            except Exception:
-                continue
+        elements: List[Tuple] = []
+        for elem in path.path_elements:
+            if isinstance(elem, TranslationTarget):
+                elements.append(
+                    (
+                        "t",
+                        float(elem.x_meters),
+                        float(elem.y_meters),
+                        elem.intermediate_handoff_radius_meters,
+                    )
+                )
+            elif isinstance(elem, RotationTarget):
+                elements.append(
+                    (
+                        "r",
+                        float(elem.rotation_radians),
+                        float(getattr(elem, "t_ratio", 0.0)),
+                        bool(getattr(elem, "profiled_rotation", True)),
+                    )
+                )
+            elif isinstance(elem, Waypoint):
+                tt = elem.translation_target
+                rt = elem.rotation_target
+                elements.append(
+                    (
+                        "w",
+                        float(tt.x_meters),
+                        float(tt.y_meters),
+                        tt.intermediate_handoff_radius_meters,
+                        float(rt.rotation_radians),
+                        bool(getattr(rt, "profiled_rotation", True)),
+                    )
+                )
+            # Other elements (e.g. event triggers) do not affect the simulation
+
+        c = getattr(path, "constraints", None)
+        constraints = (
+            getattr(c, "max_velocity_meters_per_sec", None),
+            getattr(c, "max_acceleration_meters_per_sec2", None),
+            getattr(c, "max_velocity_deg_per_sec", None),
+            getattr(c, "max_acceleration_deg_per_sec2", None),
+        )
+        ranged = tuple(
+            (rc.key, rc.value, rc.start_ordinal, rc.end_ordinal)
+            for rc in getattr(path, "ranged_constraints", []) or []
+            if isinstance(rc, RangedConstraint)
+        )
+        cfg = config or {}
+        cfg_values = tuple(cfg.get(k) for k in _CONFIG_KEYS_USED)
+        key = (tuple(elements), constraints, ranged, cfg_values, float(dt_s))
+        hash(key)
+        return key
     except Exception:
-        best = None
-    return best
+        return None
 
 
 def simulate_path(
@@ -514,26 +679,69 @@ def simulate_path(
 
     Returns:
         SimResult containing poses indexed by time, sorted timestamps, total duration,
-        and trail points for visualization.
+        and trail points for visualization. Results are memoized by input content and
+        shared between callers, so treat them as read-only.
     """
-    cfg = config or {}
-    segments, anchors, anchor_path_indices = _build_segments(path)
+    key = _simulation_signature(path, config, dt_s)
+    if key is not None:
+        cached = _sim_cache.get(key)
+        if cached is not None:
+            _sim_cache.move_to_end(key)
+            return cached
+
+    result = _simulate_geometry(path, _build_path_geometry(path), config, dt_s)
+
+    if key is not None:
+        _sim_cache[key] = result
+        while len(_sim_cache) > _SIM_CACHE_MAX_ENTRIES:
+            _sim_cache.popitem(last=False)
+    return result
+
+
+def clear_simulation_cache() -> None:
+    """Drop all memoized simulate_path results."""
+    _sim_cache.clear()
+
+
+def simulate_path_batch(
+    path: Path,
+    configs: Sequence[Optional[Dict]],
+    dt_s: float = 0.02,
+) -> List[SimResult]:
+    """Simulate the same path once per config, e.g. for a constraint sweep.
+
+    Path geometry (segments, cumulative lengths and rotation keyframes) does not
+    depend on the config, so it is built once and shared across every run.
+
+    Returns:
+        One SimResult per entry in `configs`, in the same order.
+    """
+    geometry = _build_path_geometry(path)
+    return [_simulate_geometry(path, geometry, cfg, dt_s) for cfg in configs]
+
 
-    poses_by_time: Dict[float, Tuple[float, float, float]] = {}
-    times_sorted: List[float] = []
-    trail_points: List[Tuple[float, float]] = []
+def _simulate_geometry(
+    path: Path,
+    geometry: _PathGeometry,
+    config: Optional[Dict],
+    dt_s: float,
+) -> SimResult:
+    cfg = config or {}
+    segments = geometry.segments
+    anchors = geometry.anchors
+    anchor_path_indices = geometry.anchor_path_indices
 
     if len(anchors) < 2 or len(segments) == 0:
-        if anchors:
-            x0, y0 = anchors[0]
-            poses_by_time[0.0] = (x0, y0, 0.0)
-            times_sorted = [0.0]
-            trail_points = [(x0, y0)]
+        if not anchors:
+            return SimResult(times_sorted=[], total_time_s=0.0, trail_points=[])
+        x0, y0 = anchors[0]
         return SimResult(
-            poses_by_time=poses_by_time,
-            times_sorted=times_sorted,
+            times_sorted=[0.0],
             total_time_s=0.0,
-            trail_points=trail_points,
+            trail_points=[(x0, y0)],
+            pose_x_m=[x0],
+            pose_y_m=[y0],
+            pose_theta_rad=[0.0],
         )
 
     c = getattr(path, "constraints", None)
@@ -565,67 +773,77 @@ def simulate_path(
 
     # Tiny epsilon for exact end goal termination (idealized mechanics)
     _EPS_POS = 1e-3
+    _EPS_POS_SQ = _EPS_POS * _EPS_POS
     _EPS_ANG = 1e-3
+    # Below these, the rotation controller is skipped for the step (heading held)
+    _EPS_ANG_IDLE = 1e-12
+    _EPS_OMEGA_IDLE = 1e-12
 
     # Default handoff radius from config
     default_handoff_radius = _resolve_constraint(
         None, cfg.get("default_intermediate_handoff_radius_meters"), 0.05
     )
 
-    total_path_len = 0.0
-    cumulative_lengths: List[float] = [0.0]
-    for seg in segments:
-        L = max(seg.length_m, 0.0)
-        total_path_len += L
-        cumulative_lengths.append(total_path_len)
+    total_path_len = geometry.total_path_len
+    cumulative_lengths = geometry.cumulative_lengths
+    global_keyframes = geometry.global_keyframes
 
     first_seg = segments[0]
     start_heading_base = _default_heading(first_seg.ax, first_seg.ay, first_seg.bx, first_seg.by)
 
-    # Build global rotation keyframes for rotation event ordinals and compute initial heading at s=0
-    global_keyframes = _build_global_rotation_keyframes(
-        path, anchor_path_indices, cumulative_lengths
-    )
+    # Compute initial heading at s=0
     initial_heading, _, _ = _desired_heading_for_global_s(global_keyframes, 0.0, start_heading_base)
     # Desired heading at the absolute end of the path
     end_heading_target, _, _ = _desired_heading_for_global_s(
         global_keyframes, total_path_len, start_heading_base
     )
 
+    # Resolve ranged constraints once; the loop only indexes into these tables
+    seg_max_v = _build_translation_limit_table(
+        path, "max_velocity_meters_per_sec", len(segments), base_max_v
+    )
+    seg_max_a = _build_translation_limit_table(
+        path, "max_acceleration_meters_per_sec2", len(segments), base_max_a
+    )
+    rot_limits = _build_rotation_limit_table(path, global_keyframes, base_max_omega, base_max_alpha)
+    # Cached rotation limits and the [rot_lo, rot_hi) range of s they stay valid for
+    max_omega = rot_limits.max_omega[0]
+    max_alpha = rot_limits.max_alpha[0]
+    rot_lo, rot_hi = math.inf, -math.inf
+
     x = first_seg.ax
     y = first_seg.ay
     theta = initial_heading
 
-    speeds = ChassisSpeeds(vx_mps=0.0, vy_mps=0.0, omega_radps=0.0)
+    # Last commanded chassis speeds (vx, vy, omega), kept as plain floats in the loop
+    speed_vx = 0.0
+    speed_vy = 0.0
+    speed_omega = 0.0
 
+    # Time advances by an integer tick counter so sample keys are exact and unique
+    # (microsecond resolution) instead of accumulating dt_s and rounding each step.
+    tick = 0
+    tick_us = max(1, int(round(dt_s * 1_000_000)))
     t_s = 0.0
     seg_idx = 0
     # Absolute end point
     end_x, end_y = anchors[-1]
 
-    def remaining_distance_from(
-        seg_index: int, current_x: float, current_y: float, proj_s: float
-    ) -> float:
-        """Calculate remaining path distance by summing actual distances to each subsequent target."""
-        if seg_index >= len(segments):
-            return 0.0
-
-        remaining_distance = 0.0
-        prev_x, prev_y = current_x, current_y  # Start from current position
-
-        # Iterate through all remaining segments and sum distances to each endpoint
-        for k in range(seg_index, len(segments)):
-            seg = segments[k]
-            # Add distance from previous point to end of this segment
-            remaining_distance += hypot2(seg.bx - prev_x, seg.by - prev_y)
-            # Update previous point to end of this segment
-            prev_x, prev_y = seg.bx, seg.by
-
-        return remaining_distance
+    # Per-segment invariants, resolved once instead of on every step
+    last_seg_idx = len(segments) - 1
+    seg_handoff_radius = [
+        _get_handoff_radius_for_segment(path, k, anchor_path_indices, default_handoff_radius)
+        for k in range(len(segments))
+    ]
+    # Path distance remaining past the end of each segment (sum of all later segment lengths)
+    remaining_after = [0.0] * len(segments)
+    for k in range(last_seg_idx - 1, -1, -1):
+        nxt = segments[k + 1]
+        remaining_after[k] = remaining_after[k + 1] + math.hypot(nxt.bx - nxt.ax, nxt.by - nxt.ay)
 
     # Compute a realistic guard time using the slowest effective speed limits (including ranged constraints)
     min_trans_v = float(base_max_v)
-    min_rot_omega_deg = math.degrees(float(base_max_omega))
+    min_rot_omega = float(base_max_omega)
     try:
         for rc in getattr(path, "ranged_constraints", []) or []:
             if not isinstance(rc, RangedConstraint):
@@ -641,58 +859,72 @@ def simulate_path(
                 try:
                     val = float(rc.value)
                     if val > 0.0:
-                        min_rot_omega_deg = min(min_rot_omega_deg, val)
+                        min_rot_omega = min(min_rot_omega, math.radians(val))
                 except Exception:
                     pass
     except Exception:
         pass
-    min_rot_omega = math.radians(max(1e-3, min_rot_omega_deg))
+    min_rot_omega = max(math.radians(1e-3), min_rot_omega)
     min_trans_v = max(0.1, min_trans_v)
     est_trans_time = total_path_len / min_trans_v
     est_rot_time = math.pi / min_rot_omega  # enough for 180° worst-case
     guard_time = max(3.0, 2.0 * est_trans_time + 1.5 * est_rot_time)
 
-    while t_s <= guard_time:
-        if seg_idx >= len(segments):
-            break
+    # Sample storage as parallel, preallocated columns (one slot per step plus the tail sample)
+    max_steps = int(guard_time / max(dt_s, 1e-9)) + 8
+    sample_t: List[float] = [0.0] * max_steps
+    sample_x: List[float] = [0.0] * max_steps
+    sample_y: List[float] = [0.0] * max_steps
+    sample_theta: List[float] = [0.0] * max_steps
+    n_samples = 0
+    max_tick = int(guard_time / max(dt_s, 1e-9))
+
+    # Cruise fast-forward tolerances and rotation event positions (see the end of the loop body)
+    _EPS_CRUISE_V = 1e-9
+    _EPS_CRUISE_ANG = 1e-9
+    _EPS_CRUISE_OMEGA = 1e-6
+    keyframe_s = [kf.s_m for kf in global_keyframes]
+
+    # Bind hot-loop callables to locals to avoid global and module attribute lookups per step
+    sqrt = math.sqrt
+    hypot = math.hypot
+    angular_distance = shortest_angular_distance
+    desired_heading_at = _desired_heading_from_frames
+    pi = math.pi
+    two_pi = 2.0 * math.pi
+
+    # Heading frames are fixed for the run; build them once rather than on every lookup
+    heading_frames = _build_heading_frames(global_keyframes, start_heading_base)
+    heading_frame_ends = _heading_frame_ends(heading_frames)
 
+    while t_s <= guard_time:
         seg = segments[seg_idx]
 
         dx = seg.bx - x
         dy = seg.by - y
-        dist_to_target = hypot2(dx, dy)
+        dist_to_target = hypot(dx, dy)
 
         proj_dx = x - seg.ax
         proj_dy = y - seg.ay
-        projected_s = dot(proj_dx, proj_dy, seg.ux, seg.uy)
+        projected_s = proj_dx * seg.ux + proj_dy * seg.uy
         projected_s = max(0.0, min(projected_s, seg.length_m))
 
-        # Get the current handoff radius for this segment
-        current_handoff_radius = _get_handoff_radius_for_segment(
-            path, seg_idx, anchor_path_indices, default_handoff_radius
-        )
-
         # Only advance to the next segment via handoff radius if we are NOT on the last segment.
         # For the final segment, we finish based on end tolerances instead of handoff radius.
-        while seg_idx < (len(segments) - 1) and dist_to_target <= current_handoff_radius:
+        while seg_idx < last_seg_idx and dist_to_target <= seg_handoff_radius[seg_idx]:
             seg_idx += 1
-            if seg_idx >= len(segments):
-                break
             seg = segments[seg_idx]
             dx = seg.bx - x
             dy = seg.by - y
-            dist_to_target = hypot2(dx, dy)
+            dist_to_target = hypot(dx, dy)
             proj_dx = x - seg.ax
             proj_dy = y - seg.ay
-            projected_s = dot(proj_dx, proj_dy, seg.ux, seg.uy)
+            projected_s = proj_dx * seg.ux + proj_dy * seg.uy
             projected_s = max(0.0, min(projected_s, seg.length_m))
-            # Update handoff radius for the new segment
-            current_handoff_radius = _get_handoff_radius_for_segment(
-                path, seg_idx, anchor_path_indices, default_handoff_radius
-            )
 
-        if seg_idx >= len(segments):
-            break
+        # The handoff loop never advances past the last segment; resolve the final-segment
+        # flag once here for the nudge, overshoot clamp and termination branches below.
+        on_last_seg = seg_idx == last_seg_idx
 
         if dist_to_target > 1e-9:
             ux = dx / dist_to_target
@@ -703,158 +935,210 @@ def simulate_path(
 
         # Compute desired heading using global keyframes at absolute distance along path
         global_s = cumulative_lengths[seg_idx] + projected_s
-        desired_theta, _, _ = _desired_heading_for_global_s(
-            global_keyframes, global_s, start_heading_base
+        desired_theta, dtheta_ds, _ = desired_heading_at(
+            heading_frames, heading_frame_ends, global_s
         )
 
-        remaining = remaining_distance_from(seg_idx, x, y, projected_s)
+        # Distance to this segment's target plus the length of every later segment
+        remaining = dist_to_target + remaining_after[seg_idx]
 
-        # Resolve dynamic translation constraints for this segment based on next anchor ordinal (1-based)
-        next_anchor_ord_1b = seg_idx + 2
-        max_v_eff = _active_translation_limit(
-            path, "max_velocity_meters_per_sec", next_anchor_ord_1b
-        )
-        max_a_eff = _active_translation_limit(
-            path, "max_acceleration_meters_per_sec2", next_anchor_ord_1b
-        )
-        max_v = float(max_v_eff) if max_v_eff is not None else float(base_max_v)
-        max_a = float(max_a_eff) if max_a_eff is not None else float(base_max_a)
+        # Dynamic translation constraints for this segment (precomputed per next anchor ordinal)
+        max_v = seg_max_v[seg_idx]
+        max_a = seg_max_a[seg_idx]
 
-        # Resolve dynamic rotation constraints based on the next rotation event ahead of current s
-        max_omega_eff = _active_rotation_limit(
-            path, global_keyframes, "max_velocity_deg_per_sec", global_s
-        )
-        max_alpha_eff = _active_rotation_limit(
-            path, global_keyframes, "max_acceleration_deg_per_sec2", global_s
-        )
-        max_omega = (
-            math.radians(float(max_omega_eff))
-            if max_omega_eff is not None
-            else float(base_max_omega)
-        )
-        max_alpha = (
-            math.radians(float(max_alpha_eff))
-            if max_alpha_eff is not None
-            else float(base_max_alpha)
-        )
+        # Dynamic rotation constraints based on the next rotation event ahead of current s;
+        # only re-resolved when s leaves the interval of the cached rotation target
+        if not (rot_lo <= global_s < rot_hi):
+            rot_idx = rot_limits.index_at(global_s)
+            rot_lo, rot_hi = rot_limits.bounds(rot_idx)
+            max_omega = rot_limits.max_omega[rot_idx]
+            max_alpha = rot_limits.max_alpha[rot_idx]
 
         # 2ad controller: drive remaining distance to zero
-        v_p_control = math.sqrt(2.0 * base_max_a * remaining)
+        v_p_control = sqrt(2.0 * base_max_a * remaining)
         # Cap by velocity limit; leave acceleration limiting to the limiter below
-        v_des_scalar = max(0.0, min(max_v, v_p_control))
+        v_des_scalar = min(max_v, v_p_control)
         # If on the final segment and desired velocity collapses to ~0 while still away from the endpoint,
         # nudge toward the endpoint by requesting just enough velocity to reach it within one dt (bounded by max_v).
-        if seg_idx == len(segments) - 1 and v_des_scalar <= 1e-9 and dist_to_target > _EPS_POS:
+        if on_last_seg and v_des_scalar <= 1e-9 and dist_to_target > _EPS_POS:
             v_des_scalar = min(max_v, dist_to_target / max(dt_s, 1e-9))
 
         vx_des = v_des_scalar * ux
         vy_des = v_des_scalar * uy
 
         # 2ad controller for rotation: omega = sqrt(2 * alpha * |error|)
-        angular_error = shortest_angular_distance(desired_theta, theta)
-        omega_control = math.sqrt(2.0 * max_alpha * abs(angular_error))
-        # Cap by max_omega and apply sign based on error direction
-        omega_des = min(omega_control, max_omega)
-        if angular_error < 0:
-            omega_des = -omega_des
+        angular_error = desired_theta - theta
+        while angular_error > pi:
+            angular_error -= two_pi
+        while angular_error < -pi:
+            angular_error += two_pi
+        # Heading settled and not rotating: the controller would command ~0, so skip it
+        rotation_idle = (
+            -_EPS_ANG_IDLE <= angular_error <= _EPS_ANG_IDLE
+            and -_EPS_OMEGA_IDLE <= speed_omega <= _EPS_OMEGA_IDLE
+        )
+        if not rotation_idle:
+            omega_control = sqrt(2.0 * max_alpha * abs(angular_error))
+            # Cap by max_omega and apply sign based on error direction
+            omega_des = min(omega_control, max_omega)
+            if angular_error < 0:
+                omega_des = -omega_des
 
         # Apply acceleration limiting AFTER desired speed has been clamped to max_v
-        limited = limit_acceleration(
-            desired=ChassisSpeeds(vx_des, vy_des, omega_des),
-            last=speeds,
-            dt=dt_s,
-            max_trans_accel_mps2=max_a,
-            max_angular_accel_radps2=max_alpha,
-        )
-        if abs(limited.omega_radps) > max_omega > 0.0:
-            limited = ChassisSpeeds(
-                limited.vx_mps, limited.vy_mps, math.copysign(max_omega, limited.omega_radps)
-            )
+        # (same math as limit_acceleration, inlined to avoid ChassisSpeeds per step: scale
+        # delta-v onto the max_a * dt circle, clamp alpha; keep the two in step)
+        dvx = vx_des - speed_vx
+        dvy = vy_des - speed_vy
+        dv_mag = hypot(dvx, dvy)
+        dv_cap = max_a * dt_s
+        if dv_mag > dv_cap:
+            dv_scale = dv_cap / dv_mag
+            lim_vx = speed_vx + dvx * dv_scale
+            lim_vy = speed_vy + dvy * dv_scale
+        else:
+            lim_vx = speed_vx + dvx
+            lim_vy = speed_vy + dvy
+        if rotation_idle:
+            lim_omega = 0.0
+        else:
+            alpha_des = (omega_des - speed_omega) / dt_s
+            alpha_des = max(-max_alpha, min(alpha_des, max_alpha))
+            lim_omega = speed_omega + alpha_des * dt_s
+            # lim_omega lies between speed_omega and omega_des, and |omega_des| <= max_omega, so
+            # it can only exceed max_omega when carried over from a looser limit.
+            if max_omega > 0.0 and (lim_omega > max_omega or lim_omega < -max_omega):
+                lim_omega = max_omega if lim_omega > 0.0 else -max_omega
 
         # Advance translation; clamp to final point on last segment to avoid overshoot with zero tolerances
-        step_dx = limited.vx_mps * dt_s
-        step_dy = limited.vy_mps * dt_s
-        if seg_idx == len(segments) - 1:
-            if hypot2(step_dx, step_dy) >= max(0.0, dist_to_target - _EPS_POS):
+        step_dx = lim_vx * dt_s
+        step_dy = lim_vy * dt_s
+        if on_last_seg:
+            # Compare squared magnitudes to avoid a sqrt on every final-segment step
+            overshoot_dist = max(0.0, dist_to_target - _EPS_POS)
+            if step_dx * step_dx + step_dy * step_dy >= overshoot_dist * overshoot_dist:
                 x = end_x
                 y = end_y
                 # Once at final position, zero translational components to avoid endless micro-stepping
-                limited = ChassisSpeeds(0.0, 0.0, limited.omega_radps)
+                lim_vx = 0.0
+                lim_vy = 0.0
             else:
                 x += step_dx
                 y += step_dy
         else:
             x += step_dx
             y += step_dy
-        theta = wrap_angle_radians(theta + limited.omega_radps * dt_s)
-
-        t_key = round(t_s, 3)
-        poses_by_time[t_key] = (float(x), float(y), float(theta))
-        times_sorted.append(t_key)
-
-        # Add current position to trail
-        trail_points.append((float(x), float(y)))
+        theta += lim_omega * dt_s
+        while theta > pi:
+            theta -= two_pi
+        while theta < -pi:
+            theta += two_pi
+
+        t_key = tick * tick_us / 1_000_000.0
+        sample_i = n_samples
+        sample_t[sample_i] = t_key
+        sample_x[sample_i] = x
+        sample_y[sample_i] = y
+        sample_theta[sample_i] = theta
+        n_samples += 1
 
         # Check end-of-path conditions with ideal (zero) tolerances and internal eps snapping
         # Only check final endpoint termination when on the LAST segment to avoid early termination
         # when start and end points overlap (the robot must traverse all intermediate segments first)
-        if seg_idx == len(segments) - 1:
+        if on_last_seg:
             dx_end = end_x - x
             dy_end = end_y - y
-            dist_to_final = hypot2(dx_end, dy_end)
-            rot_err = abs(shortest_angular_distance(end_heading_target, theta))
+            dist_to_final_sq = dx_end * dx_end + dy_end * dy_end
+            rot_err = abs(angular_distance(end_heading_target, theta))
 
             snapped_pos = False
             snapped_rot = False
-            if dist_to_final <= _EPS_POS:
+            if dist_to_final_sq <= _EPS_POS_SQ:
                 x = end_x
                 y = end_y
-                dist_to_final = 0.0
+                dist_to_final_sq = 0.0
                 snapped_pos = True
 
-            # Only check rotation snapping if we are close to the end point
+            # Only check rotation snapping if we are close to the end point (within 0.1 m)
             # to avoid premature snapping when start/end headings match but
             # intermediate rotation is required (e.g. W -> R -> W)
-            if dist_to_final < 0.1 and rot_err <= _EPS_ANG:
+            if dist_to_final_sq < 0.01 and rot_err <= _EPS_ANG:
                 theta = end_heading_target
-                rot_err = 0.0
                 snapped_rot = True
 
             if snapped_pos or snapped_rot:
-                poses_by_time[t_key] = (float(x), float(y), float(theta))
-                trail_points[-1] = (float(x), float(y))
+                sample_x[sample_i] = x
+                sample_y[sample_i] = y
+                sample_theta[sample_i] = theta
                 # Zero corresponding velocities after snapping to avoid dithering away from the target
                 if snapped_pos:
-                    limited = ChassisSpeeds(0.0, 0.0, limited.omega_radps)
-                    speeds = ChassisSpeeds(0.0, 0.0, speeds.omega_radps)
+                    lim_vx = 0.0
+                    lim_vy = 0.0
                 if snapped_rot:
-                    limited = ChassisSpeeds(limited.vx_mps, limited.vy_mps, 0.0)
-                    speeds = ChassisSpeeds(speeds.vx_mps, speeds.vy_mps, 0.0)
+                    lim_omega = 0.0
                 # If both snapped this step, we are exactly at the final state; terminate immediately
                 if snapped_pos and snapped_rot:
-                    speeds = ChassisSpeeds(0.0, 0.0, 0.0)
                     break
-
-        t_s += dt_s
-        speeds = limited
-
-    last_time = round(t_s, 3)
-    if last_time not in poses_by_time and times_sorted:
-        poses_by_time[last_time] = poses_by_time[times_sorted[-1]]
-        times_sorted.append(last_time)
-
-    seen = set()
-    uniq_times: List[float] = []
-    for tk in times_sorted:
-        if tk in seen:
-            continue
-        seen.add(tk)
-        uniq_times.append(tk)
-
-    total_time_s = uniq_times[-1] if uniq_times else 0.0
+        elif (
+            v_p_control >= max_v
+            and dtheta_ds == 0.0
+            and abs(angular_error) <= _EPS_CRUISE_ANG
+            and abs(lim_omega) <= _EPS_CRUISE_OMEGA
+            and abs(vx_des - lim_vx) <= _EPS_CRUISE_V
+            and abs(vy_des - lim_vy) <= _EPS_CRUISE_V
+        ):
+            # Cruising at max_v with the limiter idle and the heading settled: until the handoff
+            # radius, the braking distance or the next rotation event is reached, every following
+            # step repeats this one exactly. Emit those samples directly instead of stepping.
+            step_len = v_des_scalar * dt_s
+            next_kf = bisect_left(keyframe_s, global_s - 1e-6)
+            next_event_s = keyframe_s[next_kf] - 1e-6 if next_kf < len(keyframe_s) else math.inf
+            room = min(
+                dist_to_target - step_len - seg_handoff_radius[seg_idx],
+                remaining - step_len - v_des_scalar * v_des_scalar / (2.0 * base_max_a),
+                next_event_s - global_s - step_len,
+            )
+            n_skip = min(int(room / step_len) - 1, max_tick - tick - 1) if step_len > 0.0 else 0
+            if n_skip >= 2:
+                step_dx = vx_des * dt_s
+                step_dy = vy_des * dt_s
+                for j in range(1, n_skip + 1):
+                    sample_i = n_samples
+                    sample_t[sample_i] = (tick + j) * tick_us / 1_000_000.0
+                    sample_x[sample_i] = x + step_dx * j
+                    sample_y[sample_i] = y + step_dy * j
+                    sample_theta[sample_i] = theta
+                    n_samples += 1
+                x += step_dx * n_skip
+                y += step_dy * n_skip
+                tick += n_skip
+                lim_vx = vx_des
+                lim_vy = vy_des
+                lim_omega = 0.0
+
+        tick += 1
+        t_s = tick * dt_s
+        speed_vx = lim_vx
+        speed_vy = lim_vy
+        speed_omega = lim_omega
+
+    # The trail is every stepped position, i.e. the samples before the tail hold sample
+    n_trail = n_samples
+    last_time = tick * tick_us / 1_000_000.0
+    if n_samples and sample_t[n_samples - 1] != last_time:
+        last_i = n_samples - 1
+        sample_t[n_samples] = last_time
+        sample_x[n_samples] = sample_x[last_i]
+        sample_y[n_samples] = sample_y[last_i]
+        sample_theta[n_samples] = sample_theta[last_i]
+        n_samples += 1
+
+    times_sorted = sample_t[:n_samples]
+    total_time_s = times_sorted[-1] if times_sorted else 0.0
     return SimResult(
-        poses_by_time=poses_by_time,
-        times_sorted=uniq_times,
+        times_sorted=times_sorted,
         total_time_s=total_time_s,
-        trail_points=trail_points,
+        trail_points=list(zip(sample_x[:n_trail], sample_y[:n_trail])),
+        pose_x_m=sample_x[:n_samples],
+        pose_y_m=sample_y[:n_samples],
+        pose_theta_rad=sample_theta[:n_samples],
     )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from models.path_model import Path, TranslationTarget
-from models.simulation import simulate_path
+from models.path_model import Path, RangedConstraint, TranslationTarget
+from models.simulation import clear_simulation_cache, simulate_path, simulate_path_batch
 
 
 def test_simulate_path_generates_trail():
@@ -21,3 +21,89 @@ def test_simulate_path_generates_trail():
     assert result.total_time_s > 0.0
     assert result.trail_points
     assert 0.0 in result.poses_by_time
+
+
+def test_ranged_velocity_constraint_slows_constrained_segment():
+    path = Path()
+    path.path_elements.append(TranslationTarget(x_meters=0.0, y_meters=0.0))
+    path.path_elements.append(TranslationTarget(x_meters=4.0, y_meters=0.0))
+    path.path_elements.append(TranslationTarget(x_meters=8.0, y_meters=0.0))
+
+    config = {
+        "default_max_velocity_meters_per_sec": 3.0,
+        "default_max_acceleration_meters_per_sec2": 6.0,
+    }
+    unconstrained = simulate_path(path, config, dt_s=0.01)
+
+    path.ranged_constraints.append(
+        RangedConstraint(
+            key="max_velocity_meters_per_sec", value=1.0, start_ordinal=2, end_ordinal=2
+        )
+    )
+    constrained = simulate_path(path, config, dt_s=0.01)
+
+    assert constrained.total_time_s > unconstrained.total_time_s
+
+
+def test_simulate_path_batch_matches_individual_runs():
+    path = Path()
+    path.path_elements.append(TranslationTarget(x_meters=0.0, y_meters=0.0))
+    path.path_elements.append(TranslationTarget(x_meters=2.0, y_meters=2.0))
+
+    configs = [
+        {"default_max_velocity_meters_per_sec": 1.0},
+        {"default_max_velocity_meters_per_sec": 3.0},
+    ]
+    results = simulate_path_batch(path, configs, dt_s=0.02)
+
+    assert len(results) == len(configs)
+    for cfg, result in zip(configs, results):
+        single = simulate_path(path, cfg, dt_s=0.02)
+        assert result.times_sorted == single.times_sorted
+        assert result.total_time_s == single.total_time_s
+    assert results[0].total_time_s > results[1].total_time_s
+
+
+def test_pose_at_returns_latest_sample_at_or_before_time():
+    path = Path()
+    path.path_elements.append(TranslationTarget(x_meters=0.0, y_meters=0.0))
+    path.path_elements.append(TranslationTarget(x_meters=1.0, y_meters=0.0))
+
+    result = simulate_path(path, dt_s=0.02)
+    t_mid = result.times_sorted[len(result.times_sorted) // 2]
+
+    assert result.pose_at(t_mid) == result.poses_by_time[t_mid]
+    assert result.pose_at(t_mid + 0.01) == result.poses_by_time[t_mid]
+    assert result.pose_at(-1.0) == result.poses_by_time[result.times_sorted[0]]
+    assert result.pose_at(result.total_time_s + 1.0) == result.poses_by_time[result.total_time_s]
+    assert result.sample_index_at(t_mid + 0.01) == len(result.times_sorted) // 2
+    assert result.sample_index_at(-1.0) == 0
+
+
+def test_sample_times_are_unique_without_dedup_pass():
+    path = Path()
+    path.path_elements.append(TranslationTarget(x_meters=0.0, y_meters=0.0))
+    path.path_elements.append(TranslationTarget(x_meters=1.0, y_meters=1.0))
+
+    # Sub-millisecond steps used to collide after rounding keys to 1 ms
+    result = simulate_path(path, dt_s=0.0005)
+    times = result.times_sorted
+
+    assert all(t1 > t0 for t0, t1 in zip(times, times[1:]))
+    assert len(result.poses_by_time) == len(times) == len(result.pose_x_m)
+
+
+def test_simulate_path_memoizes_identical_inputs():
+    clear_simulation_cache()
+    path = Path()
+    path.path_elements.append(TranslationTarget(x_meters=0.0, y_meters=0.0))
+    end = TranslationTarget(x_meters=2.0, y_meters=0.0)
+    path.path_elements.append(end)
+
+    first = simulate_path(path, dt_s=0.02)
+    assert simulate_path(path, dt_s=0.02) is first
+
+    end.x_meters = 3.0
+    edited = simulate_path(path, dt_s=0.02)
+    assert edited is not first
+    assert edited.total_time_s > first.total_time_s
@@ -28,9 +28,22 @@ HANDLE_RADIUS_M = 0.12
 # Shorten rotation handle distance by 35% (from 0.70 to ~0.455)
 HANDLE_DISTANCE_M = 0.455
 
+# Element colors, shared by every item built for the path
+TRANSLATION_COLOR = QColor("#3aa3ff")
+ROTATION_COLOR = QColor("#50c878")
+WAYPOINT_COLOR = QColor("#ff7f3a")
+EVENT_TRIGGER_COLOR = QColor("#ffd54d")
+RANGE_HIGHLIGHT_COLOR = QColor("#15c915")
+
 OUTLINE_EDGE_PEN = QPen(QColor("#222222"), 0.02)
-HANDOFF_RADIUS_PEN = QPen(QColor("#FF00FF"), 0.03)
+CONNECT_LINE_PEN = QPen(QColor("#cccccc"), CONNECT_LINE_THICKNESS_M)
+RANGE_OVERLAY_PEN = QPen(RANGE_HIGHLIGHT_COLOR, CONNECT_LINE_THICKNESS_M)
+RANGE_OVERLAY_PEN.setCapStyle(Qt.RoundCap)
+# Guide outline: cosmetic, so its width is in pixels (about 0.03 m at the fitted zoom) and
+# zooming does not re-stroke it in world units
+HANDOFF_RADIUS_PEN = QPen(QColor("#FF00FF"), 1.5)
 HANDOFF_RADIUS_PEN.setStyle(Qt.DotLine)
+HANDOFF_RADIUS_PEN.setCosmetic(True)
 
 # UI and interaction constants
 DEFAULT_ZOOM_FACTOR = 1.0
@@ -40,7 +53,9 @@ ZOOM_STEP_FACTOR = 1.03
 
 # Timer intervals (in milliseconds)
 SIMULATION_UPDATE_INTERVAL_MS = 20
-SIMULATION_DEBOUNCE_INTERVAL_MS = 200
+SIMULATION_DEBOUNCE_INTERVAL_MS = 80
+SIMULATION_DRAG_DEBOUNCE_INTERVAL_MS = 250
+SLIDER_SEEK_INTERVAL_MS = 16
 
 # Default field center for element positioning
 FIELD_CENTER_X_METERS = FIELD_LENGTH_METERS / 2.0
@@ -3,7 +3,8 @@
 
 from __future__ import annotations
 import math
-from typing import Optional, List, TYPE_CHECKING
+from functools import lru_cache
+from typing import Optional, List, Tuple, TYPE_CHECKING
 
 from PySide6.QtWidgets import (
     QGraphicsEllipseItem,
@@ -11,8 +12,8 @@ from PySide6.QtWidgets import (
     QGraphicsPolygonItem,
     QGraphicsLineItem,
 )
-from PySide6.QtGui import QBrush, QColor, QPen, QPolygonF
-from PySide6.QtCore import QPointF
+from PySide6.QtGui import QBrush, QColor, QPainterPath, QPen, QPolygonF, QTransform
+from PySide6.QtCore import QPointF, QRectF
 
 from ui.qt_compat import Qt, QGraphicsItem
 
@@ -32,6 +33,88 @@ from models.path_model import Waypoint, TranslationTarget
 if TYPE_CHECKING:
     from ui.canvas.view import CanvasView
 
+# Model angles are CCW radians; scene rotation is CW degrees
+_RAD2DEG_NEG = -180.0 / math.pi
+
+# (cos, sin) at 0.5 degree steps; used to place the rotation handle while it is being dragged
+_COSSIN_STEPS_PER_RAD = 360.0 / math.pi
+_COSSIN = [
+    (math.cos(i / _COSSIN_STEPS_PER_RAD), math.sin(i / _COSSIN_STEPS_PER_RAD)) for i in range(720)
+]
+
+# Below this on-screen width the element direction triangle is not painted
+_TRIANGLE_MIN_SCREEN_PX = 4.0
+
+# Direction triangles are identical for every element of a given size; build each polygon once
+# by scaling the unit triangle.
+_UNIT_TRI = QPolygonF([QPointF(0.5, 0.0), QPointF(-0.5, 0.5), QPointF(-0.5, -0.5)])
+_TRIANGLE_POLY_CACHE: dict[float, QPolygonF] = {}
+
+
+def _triangle_polygon(base_size: float) -> QPolygonF:
+    """Return the shared forward-pointing triangle polygon for ``base_size`` (meters)."""
+    key = round(base_size, 4)
+    poly = _TRIANGLE_POLY_CACHE.get(key)
+    if poly is None:
+        poly = QTransform.fromScale(base_size, base_size).map(_UNIT_TRI)
+        _TRIANGLE_POLY_CACHE[key] = poly
+    return poly
+
+
+@lru_cache(maxsize=128)
+def _pen_for(
+    rgba: int,
+    width_m: float,
+    style=Qt.SolidLine,
+    cap=Qt.SquareCap,
+    join=Qt.BevelJoin,
+    dash_pattern: Optional[Tuple[float, ...]] = None,
+) -> QPen:
+    """Return a shared pen for the given style. Callers must not mutate the result."""
+    pen = QPen(QColor.fromRgba(rgba), width_m)
+    pen.setStyle(style)
+    if dash_pattern:
+        pen.setDashPattern(list(dash_pattern))
+    pen.setCapStyle(cap)
+    pen.setJoinStyle(join)
+    pen.setCosmetic(False)
+    return pen
+
+
+@lru_cache(maxsize=128)
+def _brush_for(rgba: int) -> QBrush:
+    """Return a shared solid brush. Callers must not mutate the result."""
+    return QBrush(QColor.fromRgba(rgba))
+
+
+def bulk_set_centers(
+    items: List[QGraphicsItem],
+    centers_m: List[Tuple[float, float]],
+    affine: Tuple[float, float, float, float],
+) -> None:
+    """Move ``items`` to model-space ``centers_m`` using the view's (sx, sy, tx, ty) mapping."""
+    sx, sy, tx, ty = affine
+    for item, (x_m, y_m) in zip(items, centers_m):
+        item.setPos(sx * x_m + tx, sy * y_m + ty)
+
+
+class _DirectionTriangleItem(QGraphicsPolygonItem):
+    """Direction triangle child that skips painting when unexposed or too small to see."""
+
+    def __init__(self, parent: QGraphicsItem):
+        super().__init__(parent)
+        # Needed so option.exposedRect reflects the dirty region rather than the bounding rect
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+
+    def paint(self, painter, option, widget=None):
+        rect = self.boundingRect()
+        if not option.exposedRect.intersects(rect):
+            return
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if lod * rect.width() < _TRIANGLE_MIN_SCREEN_PX:
+            return
+        super().paint(painter, option, widget)
+
 
 class CircleElementItem(QGraphicsEllipseItem):
     def __init__(
@@ -48,6 +131,11 @@ class CircleElementItem(QGraphicsEllipseItem):
         super().__init__()
         self.canvas_view = canvas_view
         self.index_in_model = index_in_model
+        self._cv_model_from_scene = canvas_view._model_from_scene
+        self._cv_constrain = canvas_view._constrain_scene_coords_for_index
+        self._cv_queue_live_move = canvas_view._queue_live_move
+        # Reused for constrained positions returned from itemChange (Qt copies the value)
+        self._scratch_pt = QPointF()
         self.setRect(
             -ELEMENT_CIRCLE_RADIUS_M,
             -ELEMENT_CIRCLE_RADIUS_M,
@@ -56,18 +144,20 @@ class CircleElementItem(QGraphicsEllipseItem):
         )
         self.setPos(self.canvas_view._scene_from_model(center_m.x(), center_m.y()))
         thickness = OUTLINE_THICK_M if (outline_color and not dashed_outline) else OUTLINE_THIN_M
-        pen = QPen(outline_color or QColor("#000"), thickness if outline_color else 0.0)
-        if dashed_outline:
-            pen.setStyle(Qt.DashLine)
+        pen = _pen_for(
+            (outline_color or QColor("#000")).rgba(),
+            thickness if outline_color else 0.0,
+            Qt.DashLine if dashed_outline else Qt.SolidLine,
+        )
         self.setPen(pen)
-        self.setBrush(QBrush(filled_color) if filled_color else Qt.NoBrush)
+        self.setBrush(_brush_for(filled_color.rgba()) if filled_color else Qt.NoBrush)
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
         self.setZValue(10)
         self.triangle_item: Optional[QGraphicsPolygonItem] = None
         if triangle_color is not None:
-            self.triangle_item = QGraphicsPolygonItem(self)
+            self.triangle_item = _DirectionTriangleItem(self)
             self._build_triangle(triangle_color)
         self._angle_radians: float = 0.0
 
@@ -75,42 +165,35 @@ class CircleElementItem(QGraphicsEllipseItem):
         if not self.triangle_item:
             return
         base_size = ELEMENT_CIRCLE_RADIUS_M * 2 * TRIANGLE_REL_SIZE
-        half_base = base_size * 0.5
-        height = base_size
-        points = [
-            QPointF(height / 2.0, 0.0),
-            QPointF(-height / 2.0, half_base),
-            QPointF(-height / 2.0, -half_base),
-        ]
-        self.triangle_item.setPolygon(QPolygonF(points))
-        self.triangle_item.setBrush(QBrush(color))
+        self.triangle_item.setPolygon(_triangle_polygon(base_size))
+        self.triangle_item.setBrush(_brush_for(color.rgba()))
         self.triangle_item.setPen(OUTLINE_EDGE_PEN)
         self.triangle_item.setZValue(self.zValue() + 1)
 
     def set_center(self, center_m: QPointF):
-        self.setPos(self.canvas_view._scene_from_model(center_m.x(), center_m.y()))
+        self.set_center_xy(center_m.x(), center_m.y())
+
+    def set_center_xy(self, x_m: float, y_m: float):
+        sx, sy, tx, ty = self.canvas_view._affine
+        self.setPos(sx * x_m + tx, sy * y_m + ty)
 
     def set_angle_radians(self, radians: float):
         self._angle_radians = radians
-        self.setRotation(math.degrees(-radians))
+        self.setRotation(radians * _RAD2DEG_NEG)
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
         if change == QGraphicsItem.ItemPositionChange:
             new_pos: QPointF = value
-            try:
-                cx, cy = self.canvas_view._constrain_scene_coords_for_index(
-                    self.index_in_model, new_pos.x(), new_pos.y()
-                )
-                return QPointF(cx, cy)
-            except Exception:
-                return value
+            cx, cy = self._cv_constrain(self.index_in_model, new_pos.x(), new_pos.y())
+            pt = self._scratch_pt
+            pt.setX(cx)
+            pt.setY(cy)
+            return pt
         elif change == QGraphicsItem.ItemPositionHasChanged:
-            if not getattr(self.canvas_view, "_suppress_live_events", False):
-                try:
-                    x_m, y_m = self.canvas_view._model_from_scene(self.pos().x(), self.pos().y())
-                    self.canvas_view._on_item_live_moved(self.index_in_model, x_m, y_m)
-                except Exception:
-                    pass
+            if not self.canvas_view._suppress_live_events:
+                pos = self.pos()
+                x_m, y_m = self._cv_model_from_scene(pos.x(), pos.y())
+                self._cv_queue_live_move(self.index_in_model, x_m, y_m)
         return super().itemChange(change, value)
 
     def mousePressEvent(self, event):
@@ -139,108 +222,105 @@ class RectElementItem(QGraphicsRectItem):
         filled_color: Optional[QColor],
         outline_color: Optional[QColor],
         dashed_outline: bool,
-        triangle_color: QColor,
+        triangle_color: Optional[QColor],
     ):
         super().__init__()
         self.canvas_view = canvas_view
         self.index_in_model = index_in_model
+        self._cv_model_from_scene = canvas_view._model_from_scene
+        self._cv_constrain = canvas_view._constrain_scene_coords_for_index
+        self._cv_queue_live_move = canvas_view._queue_live_move
+        # Reused for constrained positions returned from itemChange (Qt copies the value)
+        self._scratch_pt = QPointF()
         rw = getattr(self.canvas_view, "robot_length_m", 0.60)
         rh = getattr(self.canvas_view, "robot_width_m", 0.60)
         pen_width_m = OUTLINE_THICK_M if (outline_color and not dashed_outline) else OUTLINE_THIN_M
         inset = (pen_width_m if outline_color else 0.0) * 0.5
         self.setRect(-(rw / 2.0) + inset, -(rh / 2.0) + inset, rw - inset * 2, rh - inset * 2)
         self.setPos(self.canvas_view._scene_from_model(center_m.x(), center_m.y()))
-        pen = QPen(outline_color or QColor("#000"), pen_width_m if outline_color else 0.0)
+        pen_rgba = (outline_color or QColor("#000")).rgba()
+        pen_w = pen_width_m if outline_color else 0.0
         if dashed_outline:
-            try:
-                # Frequent dash pattern with visible gaps; use FlatCap so gaps remain open
-                pen.setStyle(Qt.CustomDashLine)
-                pen.setDashPattern([1, 0.5])
-            except Exception:
-                pen.setStyle(Qt.DashLine)
-            pen.setCapStyle(Qt.FlatCap)
-            # Slightly thin the dashed stroke so it doesn't read as solid
-            try:
-                current_w = float(pen.widthF())
-                pen.setWidthF(max(0.02, current_w * 0.8))
-            except Exception:
-                pass
+            # Frequent dash pattern with visible gaps; use FlatCap so gaps remain open.
+            # Slightly thin the dashed stroke so it doesn't read as solid.
+            pen = _pen_for(
+                pen_rgba,
+                max(0.02, pen_w * 0.8),
+                Qt.CustomDashLine,
+                Qt.FlatCap,
+                Qt.MiterJoin,
+                (1.0, 0.5),
+            )
         else:
-            pen.setCapStyle(Qt.SquareCap)
-        pen.setJoinStyle(Qt.MiterJoin)
-        pen.setCosmetic(False)
+            pen = _pen_for(pen_rgba, pen_w, Qt.SolidLine, Qt.SquareCap, Qt.MiterJoin)
         self.setPen(pen)
         if filled_color and not isinstance(
             self.canvas_view._path.path_elements[index_in_model], Waypoint
         ):
-            self.setBrush(QBrush(filled_color))
+            self.setBrush(_brush_for(filled_color.rgba()))
         else:
             self.setBrush(Qt.NoBrush)
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
         self.setZValue(10)
-        self.triangle_item = QGraphicsPolygonItem(self)
-        self._build_triangle(triangle_color)
-        # Tiny squares at corners to avoid voids with dashed outline
-        self._corner_squares: List[QGraphicsRectItem] = []
+        # Populate option.exposedRect with the dirty area so paint() can cull against it
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self.triangle_item: Optional[QGraphicsPolygonItem] = None
+        if triangle_color is not None:
+            self.triangle_item = _DirectionTriangleItem(self)
+            self._build_triangle(triangle_color)
+        # Tiny squares at corners to avoid voids with dashed outline; filled as one path in paint()
+        self._corner_color: Optional[QColor] = None
+        self._corner_path: Optional[QPainterPath] = None
         if dashed_outline:
-            try:
-                self._create_corner_squares(outline_color or QColor("#000"), float(pen.widthF()))
-            except Exception:
-                self._corner_squares = []
+            self._corner_color = QColor(outline_color or QColor("#000"))
+            self._corner_path = self._build_corner_path(max(0.01, float(pen.widthF())))
         self._angle_radians: float = 0.0
 
     def _build_triangle(self, color: QColor):
+        if not self.triangle_item:
+            return
         rw = getattr(self.canvas_view, "robot_length_m", 0.60)
         rh = getattr(self.canvas_view, "robot_width_m", 0.60)
         base_size = min(rw, rh) * TRIANGLE_REL_SIZE
-        half_base = base_size * 0.5
-        height = base_size
-        points = [
-            QPointF(height / 2.0, 0.0),
-            QPointF(-height / 2.0, half_base),
-            QPointF(-height / 2.0, -half_base),
-        ]
-        self.triangle_item.setPolygon(QPolygonF(points))
+        self.triangle_item.setPolygon(_triangle_polygon(base_size))
         from models.path_model import Waypoint  # local import to avoid cycle
 
         if isinstance(self.canvas_view._path.path_elements[self.index_in_model], Waypoint):
             self.triangle_item.setBrush(Qt.NoBrush)
-            p = QPen(color, OUTLINE_THICK_M)
-            p.setJoinStyle(Qt.MiterJoin)
-            p.setCapStyle(Qt.SquareCap)
-            p.setCosmetic(False)
-            self.triangle_item.setPen(p)
+            self.triangle_item.setPen(
+                _pen_for(color.rgba(), OUTLINE_THICK_M, Qt.SolidLine, Qt.SquareCap, Qt.MiterJoin)
+            )
         else:
-            self.triangle_item.setBrush(QBrush(color))
+            self.triangle_item.setBrush(_brush_for(color.rgba()))
             self.triangle_item.setPen(OUTLINE_EDGE_PEN)
         self.triangle_item.setZValue(self.zValue() + 1)
 
     def set_center(self, center_m: QPointF):
-        self.setPos(self.canvas_view._scene_from_model(center_m.x(), center_m.y()))
+        self.set_center_xy(center_m.x(), center_m.y())
+
+    def set_center_xy(self, x_m: float, y_m: float):
+        sx, sy, tx, ty = self.canvas_view._affine
+        self.setPos(sx * x_m + tx, sy * y_m + ty)
 
     def set_angle_radians(self, radians: float):
         self._angle_radians = radians
-        self.setRotation(math.degrees(-radians))
+        self.setRotation(radians * _RAD2DEG_NEG)
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
         if change == QGraphicsItem.ItemPositionChange:
             new_pos: QPointF = value
-            try:
-                cx, cy = self.canvas_view._constrain_scene_coords_for_index(
-                    self.index_in_model, new_pos.x(), new_pos.y()
-                )
-                return QPointF(cx, cy)
-            except Exception:
-                return value
+            cx, cy = self._cv_constrain(self.index_in_model, new_pos.x(), new_pos.y())
+            pt = self._scratch_pt
+            pt.setX(cx)
+            pt.setY(cy)
+            return pt
         elif change == QGraphicsItem.ItemPositionHasChanged:
-            if not getattr(self.canvas_view, "_suppress_live_events", False):
-                try:
-                    x_m, y_m = self.canvas_view._model_from_scene(self.pos().x(), self.pos().y())
-                    self.canvas_view._on_item_live_moved(self.index_in_model, x_m, y_m)
-                except Exception:
-                    pass
+            if not self.canvas_view._suppress_live_events:
+                pos = self.pos()
+                x_m, y_m = self._cv_model_from_scene(pos.x(), pos.y())
+                self._cv_queue_live_move(self.index_in_model, x_m, y_m)
         return super().itemChange(change, value)
 
     def mousePressEvent(self, event):
@@ -259,12 +339,30 @@ class RectElementItem(QGraphicsRectItem):
         super().mouseReleaseEvent(event)
 
     def paint(self, painter, option, widget=None):  # noqa: D401
+        exposed = option.exposedRect
+        if not exposed.intersects(self.boundingRect()):
+            return
         try:
             painter.setRenderHint(painter.Antialiasing, False)  # type: ignore
             painter.setRenderHint(painter.HighQualityAntialiasing, False)  # type: ignore
         except Exception:
             pass
         super().paint(painter, option, widget)
+        if self._corner_path is not None:
+            painter.fillPath(self._corner_path, self._corner_color)
+
+    def _build_corner_path(self, size: float) -> QPainterPath:
+        r = self.rect()
+        half = size * 0.5
+        path = QPainterPath()
+        for cx, cy in (
+            (r.left(), r.top()),
+            (r.right(), r.top()),
+            (r.left(), r.bottom()),
+            (r.right(), r.bottom()),
+        ):
+            path.addRect(QRectF(cx - half, cy - half, size, size))
+        return path
 
     def _create_corner_caps(self, color: QColor, pen_width_m: float, subtle: bool = False):
         # Deprecated: kept for reference
@@ -308,36 +406,6 @@ class RectElementItem(QGraphicsRectItem):
         _add_line(right - cap_len, bottom, right, bottom)
         _add_line(right, bottom - cap_len, right, bottom)
 
-    def _create_corner_squares(self, color: QColor, pen_width_m: float):
-        # Clear any existing squares
-        for it in getattr(self, "_corner_squares", []) or []:
-            try:
-                if it.scene():
-                    it.scene().removeItem(it)
-            except Exception:
-                pass
-        self._corner_squares = []
-        r = self.rect()
-        left = r.left()
-        right = r.right()
-        top = r.top()
-        bottom = r.bottom()
-        size = max(0.01, float(pen_width_m))
-        half = size * 0.5
-
-        def _add_square(cx, cy):
-            sq = QGraphicsRectItem(self)
-            sq.setRect(cx - half, cy - half, size, size)
-            sq.setBrush(QBrush(color))
-            sq.setPen(Qt.NoPen)
-            sq.setZValue(self.zValue() + 0.6)
-            self._corner_squares.append(sq)
-
-        _add_square(left, top)
-        _add_square(right, top)
-        _add_square(left, bottom)
-        _add_square(right, bottom)
-
 
 class EventTriggerItem(QGraphicsLineItem):
     def __init__(
@@ -352,6 +420,11 @@ class EventTriggerItem(QGraphicsLineItem):
         super().__init__()
         self.canvas_view = canvas_view
         self.index_in_model = index_in_model
+        self._cv_model_from_scene = canvas_view._model_from_scene
+        self._cv_constrain = canvas_view._constrain_scene_coords_for_index
+        self._cv_queue_live_move = canvas_view._queue_live_move
+        # Reused for constrained positions returned from itemChange (Qt copies the value)
+        self._scratch_pt = QPointF()
         self._angle_radians: float = 0.0
         self._length_m = float(length_m)
         half = self._length_m * 0.5
@@ -369,11 +442,15 @@ class EventTriggerItem(QGraphicsLineItem):
         self.setZValue(12)
 
     def set_center(self, center_m: QPointF):
-        self.setPos(self.canvas_view._scene_from_model(center_m.x(), center_m.y()))
+        self.set_center_xy(center_m.x(), center_m.y())
+
+    def set_center_xy(self, x_m: float, y_m: float):
+        sx, sy, tx, ty = self.canvas_view._affine
+        self.setPos(sx * x_m + tx, sy * y_m + ty)
 
     def set_angle_radians(self, radians: float):
         self._angle_radians = radians
-        self.setRotation(math.degrees(-radians))
+        self.setRotation(radians * _RAD2DEG_NEG)
 
     def set_length(self, length_m: float):
         self._length_m = float(length_m)
@@ -383,20 +460,16 @@ class EventTriggerItem(QGraphicsLineItem):
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
         if change == QGraphicsItem.ItemPositionChange:
             new_pos: QPointF = value
-            try:
-                cx, cy = self.canvas_view._constrain_scene_coords_for_index(
-                    self.index_in_model, new_pos.x(), new_pos.y()
-                )
-                return QPointF(cx, cy)
-            except Exception:
-                return value
+            cx, cy = self._cv_constrain(self.index_in_model, new_pos.x(), new_pos.y())
+            pt = self._scratch_pt
+            pt.setX(cx)
+            pt.setY(cy)
+            return pt
         elif change == QGraphicsItem.ItemPositionHasChanged:
-            if not getattr(self.canvas_view, "_suppress_live_events", False):
-                try:
-                    x_m, y_m = self.canvas_view._model_from_scene(self.pos().x(), self.pos().y())
-                    self.canvas_view._on_item_live_moved(self.index_in_model, x_m, y_m)
-                except Exception:
-                    pass
+            if not self.canvas_view._suppress_live_events:
+                pos = self.pos()
+                x_m, y_m = self._cv_model_from_scene(pos.x(), pos.y())
+                self._cv_queue_live_move(self.index_in_model, x_m, y_m)
         return super().itemChange(change, value)
 
     def mousePressEvent(self, event):
@@ -434,20 +507,18 @@ class RotationHandle(QGraphicsEllipseItem):
         # Make the handle invisible but still interactive: fully transparent fill, no pen
         self.setBrush(QBrush(QColor(0, 0, 0, 0)))
         self.setPen(Qt.NoPen)
+        # Nothing to draw; skip paint traversal while keeping hit-testing
+        self.setFlag(QGraphicsItem.ItemHasNoContents, True)
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
         self.setFlag(QGraphicsItem.ItemIsSelectable, False)
         self.setZValue(12)
         self._angle_radians: float = 0.0
-        # Remove the visual link line; keep an instance for legacy calls but make it non-drawing
-        self.link_line = QGraphicsLineItem()
-        self.link_line.setPen(Qt.NoPen)
-        self.link_line.setZValue(11)
         self.setRect(-handle_radius_m, -handle_radius_m, handle_radius_m * 2, handle_radius_m * 2)
         self.sync_to_angle()
 
     def scene_items(self) -> List[QGraphicsItem]:
-        # Only the (invisible) handle participates in the scene; the link line is omitted
+        # Only the (invisible) handle participates in the scene
         return [self]
 
     def set_angle(self, radians: float):
@@ -464,7 +535,6 @@ class RotationHandle(QGraphicsEllipseItem):
             hx = cx + math.cos(angle_scene) * front_offset_m
             hy = cy + math.sin(angle_scene) * front_offset_m
             self.setPos(QPointF(hx, hy))
-            # No link line to update (kept for legacy but non-drawing)
         finally:
             self._syncing = False
 
@@ -479,8 +549,13 @@ class RotationHandle(QGraphicsEllipseItem):
                 angle_scene = math.atan2(dy, dx)
                 # Constrain movement to the front-edge midpoint radius
                 front_offset_m = float(self.center_item.rect().width()) * 0.5
-                hx = cx + math.cos(angle_scene) * front_offset_m
-                hy = cy + math.sin(angle_scene) * front_offset_m
+                if self._dragging:
+                    # Handle placement only needs to be visually exact; the angle stays exact
+                    c, s = _COSSIN[int(round(angle_scene * _COSSIN_STEPS_PER_RAD)) % 720]
+                else:
+                    c, s = math.cos(angle_scene), math.sin(angle_scene)
+                hx = cx + c * front_offset_m
+                hy = cy + s * front_offset_m
                 angle_model = -angle_scene
                 self._angle_radians = angle_model
                 if not self._syncing and self._dragging:
@@ -525,9 +600,15 @@ class HandoffRadiusVisualizer(QGraphicsEllipseItem):
         self.setZValue(20)
         self.setFlag(QGraphicsItem.ItemIsMovable, False)
         self.setFlag(QGraphicsItem.ItemIsSelectable, False)
+        # Static outline: rasterize once and blit on pan/zoom repaints
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
     def set_center(self, center_m: QPointF):
-        self.setPos(self.canvas_view._scene_from_model(center_m.x(), center_m.y()))
+        self.set_center_xy(center_m.x(), center_m.y())
+
+    def set_center_xy(self, x_m: float, y_m: float):
+        sx, sy, tx, ty = self.canvas_view._affine
+        self.setPos(sx * x_m + tx, sy * y_m + ty)
 
     def set_radius(self, radius_m: float):
         self.radius_m = radius_m
@@ -13,6 +13,12 @@ from ui.qt_compat import QGraphicsItem
 if TYPE_CHECKING:
     from ui.canvas.view import CanvasView
 
+# Model angles are CCW radians; scene rotation is CW degrees
+_RAD2DEG_NEG = -180.0 / math.pi
+
+# Heading triangle polygons keyed by (robot_length_m, robot_width_m)
+_TRIANGLE_POLY_CACHE: dict[tuple[float, float], QPolygonF] = {}
+
 
 class RobotSimItem(QGraphicsRectItem):
     def __init__(self, canvas_view: "CanvasView"):
@@ -47,21 +53,31 @@ class RobotSimItem(QGraphicsRectItem):
     def _build_triangle(self, robot_length_m: float, robot_width_m: float):
         if not self.triangle_item:
             return
-        triangle_size = min(robot_length_m, robot_width_m) * 0.3
-        triangle_offset = robot_length_m * 0.3
-        points = [
-            QPointF(triangle_offset + triangle_size, 0.0),
-            QPointF(triangle_offset - triangle_size / 2, triangle_size / 2),
-            QPointF(triangle_offset - triangle_size / 2, -triangle_size / 2),
-        ]
-        self.triangle_item.setPolygon(QPolygonF(points))
+        key = (round(robot_length_m, 4), round(robot_width_m, 4))
+        poly = _TRIANGLE_POLY_CACHE.get(key)
+        if poly is None:
+            triangle_size = min(robot_length_m, robot_width_m) * 0.3
+            triangle_offset = robot_length_m * 0.3
+            points = [
+                QPointF(triangle_offset + triangle_size, 0.0),
+                QPointF(triangle_offset - triangle_size / 2, triangle_size / 2),
+                QPointF(triangle_offset - triangle_size / 2, -triangle_size / 2),
+            ]
+            poly = QPolygonF(points)
+            _TRIANGLE_POLY_CACHE[key] = poly
+        self.triangle_item.setPolygon(poly)
         self.triangle_item.setBrush(QBrush(QColor("#FFFFFF")))
         self.triangle_item.setPen(QPen(QColor("#000000"), 0.02))
         self.triangle_item.setZValue(self.zValue() + 1)
 
     def set_center(self, center_m: QPointF):
-        self.setPos(self.canvas_view._scene_from_model(center_m.x(), center_m.y()))
+        self.set_center_xy(center_m.x(), center_m.y())
+
+    def set_center_xy(self, x_m: float, y_m: float):
+        # Called every playback frame; apply the view's affine mapping inline
+        sx, sy, tx, ty = self.canvas_view._affine
+        self.setPos(sx * x_m + tx, sy * y_m + ty)
 
     def set_angle_radians(self, radians: float):
         self._angle_radians = radians
-        self.setRotation(math.degrees(-radians))
+        self.setRotation(radians * _RAD2DEG_NEG)
@@ -14,10 +14,24 @@ from PySide6.QtWidgets import (
     QGraphicsScene,
     QGraphicsPixmapItem,
     QGraphicsLineItem,
+    QGraphicsPathItem,
+    QGraphicsRectItem,
+    QGraphicsProxyWidget,
     QFrame,
 )
-from PySide6.QtCore import QPointF, QTimer, Signal, QPoint
-from PySide6.QtGui import QPixmap, QTransform, QColor, QPen, QBrush, QPixmapCache
+from PySide6.QtCore import QPointF, QTimer, Signal, QPoint, QThreadPool
+from PySide6.QtGui import (
+    QImage,
+    QPixmap,
+    QTransform,
+    QColor,
+    QPen,
+    QBrush,
+    QPixmapCache,
+    QPainterPath,
+    QPolygonF,
+    QGuiApplication,
+)
 
 from ui.qt_compat import Qt, QPainter, QGraphicsItem
 
@@ -38,6 +52,15 @@ from .constants import (
     ZOOM_STEP_FACTOR,
     SIMULATION_UPDATE_INTERVAL_MS,
     SIMULATION_DEBOUNCE_INTERVAL_MS,
+    SIMULATION_DRAG_DEBOUNCE_INTERVAL_MS,
+    SLIDER_SEEK_INTERVAL_MS,
+    TRANSLATION_COLOR,
+    ROTATION_COLOR,
+    WAYPOINT_COLOR,
+    EVENT_TRIGGER_COLOR,
+    RANGE_HIGHLIGHT_COLOR,
+    CONNECT_LINE_PEN,
+    RANGE_OVERLAY_PEN,
 )
 from .items.elements import (
     CircleElementItem,
@@ -45,11 +68,26 @@ from .items.elements import (
     RotationHandle,
     HandoffRadiusVisualizer,
     EventTriggerItem,
+    bulk_set_centers,
 )
 from .items.sim import RobotSimItem
 from .components.transport import TransportControls
 
 
+# Integer kind tags per path index, so per-frame helpers dispatch without isinstance
+_KIND_TRANSLATION = 0
+_KIND_ROTATION = 1
+_KIND_WAYPOINT = 2
+_KIND_EVENT_TRIGGER = 3
+_KIND_OTHER = 4
+_KIND_BY_TYPE = {
+    TranslationTarget: _KIND_TRANSLATION,
+    RotationTarget: _KIND_ROTATION,
+    Waypoint: _KIND_WAYPOINT,
+    EventTrigger: _KIND_EVENT_TRIGGER,
+}
+
+
 def _get_translation_position(element: Any) -> Tuple[float, float]:
     """Get the translation position (x, y) from a TranslationTarget or Waypoint element."""
     if isinstance(element, TranslationTarget):
@@ -66,10 +104,14 @@ class CanvasView(QGraphicsView):
     # Signals (mirroring original)
     elementSelected = Signal(int)
     elementMoved = Signal(int, float, float)
+    # Several elements moved at once (indices, x metres, y metres); one model/UI update per batch
+    elementsMoved = Signal(list, list, list)
     elementRotated = Signal(int, float)
     elementDragFinished = Signal(int)
     deleteSelectedRequested = Signal()
     rotationDragFinished = Signal(int)
+    # Emitted from a pool thread once the field image is decoded (image path, image)
+    _fieldImageDecoded = Signal(str, QImage)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -96,6 +138,19 @@ class CanvasView(QGraphicsView):
             pass
         self._is_fitting = False
         self._suppress_live_events = False
+        # Rebuild requested while live events were suppressed; started once on exit
+        self._sim_rebuild_pending = False
+        # Drag positions coalesced per element index; dispatched once per event-loop pass
+        self._pending_live_moves: dict[int, Tuple[float, float]] = {}
+        self._live_move_timer: QTimer = QTimer(self)
+        self._live_move_timer.setSingleShot(True)
+        self._live_move_timer.setInterval(0)
+        self._live_move_timer.timeout.connect(self._flush_live_moves)
+        # While dragging, Qt's per-item viewport invalidation is off and one repaint runs per pass
+        self._drag_viewport_batching = False
+        self._drag_frame_pending = False
+        # Rotation/event items are reprojected at most once per event-loop pass
+        self._reproject_pending = False
         self._rotation_t_cache: Optional[dict[int, float]] = None
         self._anchor_drag_in_progress = False
         self._zoom_factor = DEFAULT_ZOOM_FACTOR
@@ -103,21 +158,57 @@ class CanvasView(QGraphicsView):
         self._max_zoom = MAX_ZOOM_FACTOR
         self._is_panning = False
         self._pan_start: Optional[QPoint] = None
+        # Set while a pan adjusts both scrollbars so the overlay is re-anchored once
+        self._defer_overlay_reposition = False
         self.robot_length_m = ELEMENT_RECT_WIDTH_M
         self.robot_width_m = ELEMENT_RECT_HEIGHT_M
         self._field_offset: float = FIELD_OFFSET_M  # 0.5m for 2026
+        # Model->scene mapping as (sx, sy, tx, ty): scene = (sx * x + tx, sy * y + ty)
+        self._affine: Tuple[float, float, float, float] = (
+            1.0,
+            -1.0,
+            self._field_offset,
+            FIELD_WIDTH_METERS - self._field_offset,
+        )
         self.graphics_scene = QGraphicsScene(self)
+        # A few dozen items: a linear scan beats keeping a BSP tree current through every
+        # rebuild and drag step
+        self.graphics_scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.graphics_scene)
         self.graphics_scene.setSceneRect(0, 0, FIELD_LENGTH_METERS, FIELD_WIDTH_METERS)
         self._field_pixmap_item: Optional[QGraphicsPixmapItem] = None
+        self._field_placeholder_item: Optional[QGraphicsRectItem] = None
+        self._fieldImageDecoded.connect(self._apply_field_background)
         self._path: Optional[Path] = None
         self._items: List[Tuple[str, RectElementItem, Optional[RotationHandle]]] = []
-        self._connect_lines: List[QGraphicsLineItem] = []
+        # (kind, id(element)) per slot in _items, used to diff structural rebuilds
+        self._item_keys: List[Tuple[str, int]] = []
+        # Per path/item index: nearest translation/waypoint before/after it (-1 when none)
+        self._prev_anchor_of: List[int] = []
+        self._next_anchor_of: List[int] = []
+        # Per path index: rotation of the nearest rotation target/waypoint before it
+        self._angle_for_index: List[float] = []
+        # Per path index: _KIND_* tag of the element, rebuilt with the anchor tables
+        self._kind_for_index: List[int] = []
+        # Path indices by role: translation anchors, rotation anchors (rotation targets and
+        # waypoints), and items projected onto their anchor segment (rotations, event triggers)
+        self._translation_anchor_indices: List[int] = []
+        self._rotation_anchor_indices: List[int] = []
+        self._projected_indices: List[int] = []
+        # All element-to-element connector segments live in one path item
+        self._connect_path_item = QGraphicsPathItem()
+        self._connect_path_item.setPen(CONNECT_LINE_PEN)
+        self._connect_path_item.setZValue(5)
+        self._connect_path_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        # Path items hang off invisible roots so a full clear is one removeItem per root;
+        # the roots' z values keep elements below the trail/robot and rings above them
+        self._path_root = self._new_scene_root(10)
+        self._handoff_root = self._new_scene_root(20)
+        self._connect_path_item.setParentItem(self._path_root)
         self._handoff_visualizers: List[Optional[HandoffRadiusVisualizer]] = []
         self._load_field_background(":/assets/field26.png")
         # Simulation state
         self._sim_result: Optional[SimResult] = None
-        self._sim_poses_by_time: dict[float, tuple[float, float, float]] = {}
         self._sim_times_sorted: list[float] = []
         self._sim_total_time_s = 0.0
         self._sim_current_time_s = 0.0
@@ -128,22 +219,71 @@ class CanvasView(QGraphicsView):
         self._sim_debounce.setSingleShot(True)
         self._sim_debounce.setInterval(SIMULATION_DEBOUNCE_INTERVAL_MS)
         self._sim_debounce.timeout.connect(self._rebuild_simulation_now)
+        # Slider scrubbing seeks at most once per interval; the latest slider value wins
+        self._seek_throttle: QTimer = QTimer(self)
+        self._seek_throttle.setSingleShot(True)
+        self._seek_throttle.setInterval(SLIDER_SEEK_INTERVAL_MS)
+        self._seek_throttle.timeout.connect(self._flush_slider_seek)
         self._sim_robot_item: Optional[RobotSimItem] = None
         self._ensure_sim_robot_item()
-        self._trail_lines: List[QGraphicsLineItem] = []
+        # Played-back portion of the trail, grown with lineTo as the timeline advances
+        self._trail_path_item: Optional[QGraphicsPathItem] = None
+        self._trail_path = QPainterPath()
         self._trail_points: List[Tuple[float, float]] = []
+        self._trail_scene_points: List[QPointF] = []
+        self._trail_drawn_index = 0
+        # Sample index and label text shown by the last seek (skips redundant updates)
+        self._last_seek_index = -1
+        self._last_time_label = ""
         self.transport = TransportControls(self)
         self.transport.ensure()
         self._range_overlay_lines: List[QGraphicsLineItem] = []
+        # Every overlay segment item ever created; hidden ones are reused by later previews
+        self._range_overlay_pool: List[QGraphicsLineItem] = []
         self._range_overlay_saved_item_styles: dict[QGraphicsItem, Tuple[QPen, QBrush]] = {}
 
     # ---------------- Field Background ----------------
     def _load_field_background(self, image_path: str):
-        pixmap = QPixmap(image_path)
-        if pixmap.isNull():
+        # Decoding the field PNG is the expensive part; share the result across canvases
+        cache_key = f"field_bg::{image_path}"
+        pixmap = QPixmap()
+        if QPixmapCache.find(cache_key, pixmap):
+            self._set_field_pixmap(pixmap)
             return
+        # Decode off the GUI thread; a flat field-coloured rect stands in until it arrives
+        placeholder = QGraphicsRectItem(0.0, 0.0, FIELD_LENGTH_METERS, FIELD_WIDTH_METERS)
+        placeholder.setPen(Qt.NoPen)
+        placeholder.setBrush(QColor("#000000"))
+        placeholder.setZValue(-10)
+        self.graphics_scene.addItem(placeholder)
+        self._field_placeholder_item = placeholder
+        QThreadPool.globalInstance().start(lambda: self._decode_field_image(image_path))
+
+    def _decode_field_image(self, image_path: str):
+        # Runs on a pool thread; the queued signal hands the image back to the GUI thread
+        image = QImage(image_path)
+        try:
+            self._fieldImageDecoded.emit(image_path, image)
+        except RuntimeError:
+            # Canvas was destroyed while the image was decoding
+            pass
+
+    def _apply_field_background(self, image_path: str, image: QImage):
+        if self._field_placeholder_item is not None:
+            self.graphics_scene.removeItem(self._field_placeholder_item)
+            self._field_placeholder_item = None
+        if image.isNull():
+            return
+        # QPixmap must be created on the GUI thread
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(f"field_bg::{image_path}", pixmap)
+        self._set_field_pixmap(pixmap)
+
+    def _set_field_pixmap(self, pixmap: QPixmap):
         self._field_pixmap_item = QGraphicsPixmapItem(pixmap)
         self._field_pixmap_item.setZValue(-10)
+        # Avoid re-sampling the large field image on every repaint
+        self._field_pixmap_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         if pixmap.width() > 0 and pixmap.height() > 0:
             # Scale the background so it fully fits inside the logical field rectangle
             # while preserving aspect ratio. Previously a hard‑coded PPM (200) was applied
@@ -182,7 +322,7 @@ class CanvasView(QGraphicsView):
             pass
         self._rebuild_items()
         if self._path:
-            self._reproject_rotation_items_in_scene()
+            self._reproject_now()
         self.request_simulation_rebuild()
 
     def set_robot_dimensions(self, length_m: float, width_m: float):
@@ -191,9 +331,11 @@ class CanvasView(QGraphicsView):
             self.robot_width_m = float(width_m)
         except Exception:
             return
+        # Item geometry depends on the robot size, so nothing can be reused
+        self._clear_scene_items()
         self._rebuild_items()
         if self._path:
-            self._reproject_rotation_items_in_scene()
+            self._reproject_now()
         try:
             self._ensure_sim_robot_item()
             if self._sim_robot_item:
@@ -207,6 +349,7 @@ class CanvasView(QGraphicsView):
             return
         from models.path_model import TranslationTarget, Waypoint
 
+        default_radius = self._default_handoff_radius()
         for i, (kind, item, _handle) in enumerate(self._items):
             if i >= len(self._handoff_visualizers):
                 continue
@@ -236,61 +379,55 @@ class CanvasView(QGraphicsView):
                     element.translation_target, "intermediate_handoff_radius_meters", None
                 )
             if radius is None or radius <= 0:
-                try:
-                    if hasattr(self, "_project_manager") and self._project_manager:
-                        default_radius = self._project_manager.get_default_optional_value(
-                            "intermediate_handoff_radius_meters"
-                        )
-                        if default_radius and default_radius > 0:
-                            radius = default_radius
-                except Exception:
-                    pass
+                radius = default_radius
             current = self._handoff_visualizers[i]
             if radius and radius > 0 and current is None:
                 hv = HandoffRadiusVisualizer(self, QPointF(pos[0], pos[1]), radius)
-                self.graphics_scene.addItem(hv)
+                hv.setParentItem(self._handoff_root)
                 self._handoff_visualizers[i] = hv
             elif (not radius or radius <= 0) and current is not None:
                 self.graphics_scene.removeItem(current)
                 current.deleteLater()
                 self._handoff_visualizers[i] = None
             elif radius and radius > 0 and current is not None:
-                current.set_center(QPointF(pos[0], pos[1]))
+                current.set_center_xy(pos[0], pos[1])
                 current.set_radius(radius)
         self.request_simulation_rebuild()
 
     def refresh_from_model(self):
         if self._path is None or not self._items:
             return
+        self._build_anchor_tables()
+        self._build_angle_table()
         self._suppress_live_events = True
         try:
             count = min(len(self._items), len(self._path.path_elements))
+            centers = [self._element_position_for_index(i) for i in range(count)]
+            bulk_set_centers([self._items[i][1] for i in range(count)], centers, self._affine)
+            visualized = [
+                (hv, centers[i]) for i, hv in enumerate(self._handoff_visualizers[:count]) if hv
+            ]
+            bulk_set_centers([hv for hv, _ in visualized], [c for _, c in visualized], self._affine)
+            elements = self._path.path_elements
             for i in range(count):
-                try:
-                    kind, item, handle = self._items[i]
-                    element = self._path.path_elements[i]
-                    pos = self._element_position_for_index(i)
-                    item.set_center(QPointF(pos[0], pos[1]))
-                    if i < len(self._handoff_visualizers) and self._handoff_visualizers[i]:
-                        self._handoff_visualizers[i].set_center(QPointF(pos[0], pos[1]))
-                    if kind in ("rotation", "waypoint"):
-                        angle = self._element_rotation(element)
-                    else:
-                        angle = self._angle_for_translation_index(i)
-                    if kind == "event_trigger":
-                        item.set_angle_radians(self._event_trigger_angle_for_index(i))
-                    else:
-                        item.set_angle_radians(angle)
-                    if handle:
-                        handle.set_angle(angle)
-                        handle.sync_to_angle()
-                except Exception:
-                    continue
+                kind, item, handle = self._items[i]
+                if kind in ("rotation", "waypoint"):
+                    angle = self._element_rotation(elements[i])
+                else:
+                    angle = self._angle_for_translation_index(i)
+                if kind == "event_trigger":
+                    item.set_angle_radians(self._event_trigger_angle_for_index(i))
+                else:
+                    item.set_angle_radians(angle)
+                if handle:
+                    handle.set_angle(angle)
+                    handle.sync_to_angle()
         finally:
             self._suppress_live_events = False
+            self._flush_pending_simulation_rebuild()
         self._update_connecting_lines()
         if self._path:
-            self._reproject_rotation_items_in_scene()
+            self._reproject_now()
         self.request_simulation_rebuild()
 
     def refresh_rotations_from_model(self):
@@ -305,7 +442,7 @@ class CanvasView(QGraphicsView):
             try:
                 element = self._path.path_elements[i]
                 pos = self._element_position_for_index(i)
-                item.set_center(QPointF(pos[0], pos[1]))
+                item.set_center_xy(pos[0], pos[1])
                 if handle:
                     angle = self._element_rotation(element)
                     item.set_angle_radians(angle)
@@ -374,151 +511,254 @@ class CanvasView(QGraphicsView):
             self._is_fitting = False
 
     # ------------- Item build -------------
-    def _clear_scene_items(self):
-        for _, item, handle in self._items:
-            self.graphics_scene.removeItem(item)
-            if handle:
-                [self.graphics_scene.removeItem(sub) for sub in handle.scene_items()]
-        for line in self._connect_lines:
-            self.graphics_scene.removeItem(line)
-        for viz in self._handoff_visualizers:
-            if viz:
-                self.graphics_scene.removeItem(viz)
+    def _new_scene_root(self, z: float) -> QGraphicsRectItem:
+        root = QGraphicsRectItem()
+        root.setFlag(QGraphicsItem.ItemHasNoContents)
+        root.setZValue(z)
+        self.graphics_scene.addItem(root)
+        return root
+
+    def _clear_scene_items(self, keep: Optional[set] = None):
+        # A removed drag grabber never reports its release; don't leave the viewport frozen
+        self._end_drag_viewport_batching()
+        # Items listed in ``keep`` stay in the scene so _rebuild_items can reuse them
+        if keep:
+            for _, item, handle in self._items:
+                if item in keep:
+                    continue
+                self.graphics_scene.removeItem(item)
+                if handle:
+                    [self.graphics_scene.removeItem(sub) for sub in handle.scene_items()]
+        else:
+            old_root = self._path_root
+            self._path_root = self._new_scene_root(10)
+            self._connect_path_item.setParentItem(self._path_root)
+            self.graphics_scene.removeItem(old_root)
+        self._connect_path_item.setPath(QPainterPath())
+        old_root = self._handoff_root
+        self._handoff_root = self._new_scene_root(20)
+        self.graphics_scene.removeItem(old_root)
         self._items.clear()
-        self._connect_lines.clear()
+        self._item_keys.clear()
+        self._prev_anchor_of = []
+        self._next_anchor_of = []
+        self._kind_for_index = []
+        self._translation_anchor_indices = []
+        self._rotation_anchor_indices = []
+        self._projected_indices = []
         self._handoff_visualizers.clear()
+        self._pending_live_moves.clear()
+
+    @staticmethod
+    def _element_kind(element) -> Optional[str]:
+        if isinstance(element, TranslationTarget):
+            return "translation"
+        if isinstance(element, RotationTarget):
+            return "rotation"
+        if isinstance(element, EventTrigger):
+            return "event_trigger"
+        if isinstance(element, Waypoint):
+            return "waypoint"
+        return None
 
     def _rebuild_items(self):
-        self._clear_scene_items()
+        # Items whose element object survived keep their scene item (and its
+        # pixmap cache); only structurally new elements get fresh items.
+        reusable = {
+            key: (item, handle) for key, (_, item, handle) in zip(self._item_keys, self._items)
+        }
+        if self._path is not None:
+            live_keys = {(self._element_kind(e), id(e)) for e in self._path.path_elements}
+            keep = {item for key, (item, _) in reusable.items() if key in live_keys}
+        else:
+            keep = set()
+        self._clear_scene_items(keep)
         if self._path is None:
             return
+        self._build_anchor_tables()
+        self._build_angle_table()
+        last_index = len(self._path.path_elements) - 1
+        default_radius = self._default_handoff_radius()
         for i, element in enumerate(self._path.path_elements):
+            kind = self._element_kind(element)
+            if kind is None:
+                continue
+            key = (kind, id(element))
             pos = self._element_position_for_index(i)
-            if isinstance(element, TranslationTarget):
-                kind = "translation"
-                item = CircleElementItem(
-                    self,
-                    QPointF(*pos),
-                    i,
-                    filled_color=QColor("#3aa3ff"),
-                    outline_color=QColor("#3aa3ff"),
-                    dashed_outline=False,
-                    triangle_color=None,
-                )
-                rotation_handle = None
-                item.set_angle_radians(self._angle_for_translation_index(i))
-                handoff_visualizer = None
-                radius = getattr(element, "intermediate_handoff_radius_meters", None)
-                if (
-                    (radius is None or radius <= 0)
-                    and hasattr(self, "_project_manager")
-                    and self._project_manager
-                ):
-                    try:
-                        default_radius = self._project_manager.get_default_optional_value(
-                            "intermediate_handoff_radius_meters"
-                        )
-                        if default_radius and default_radius > 0:
-                            radius = default_radius
-                    except Exception:
-                        pass
-                # Skip creating visualizer for the last element
-                if radius and radius > 0 and i != len(self._path.path_elements) - 1:
-                    hv = HandoffRadiusVisualizer(self, QPointF(*pos), radius)
-                    self.graphics_scene.addItem(hv)
-                    handoff_visualizer = hv
-            elif isinstance(element, RotationTarget):
-                kind = "rotation"
-                item = RectElementItem(
-                    self,
-                    QPointF(*pos),
-                    i,
-                    filled_color=None,
-                    outline_color=QColor("#50c878"),
-                    dashed_outline=True,
-                    triangle_color=QColor("#50c878"),
-                )
-                rotation_handle = RotationHandle(
-                    self, item, HANDLE_DISTANCE_M, HANDLE_RADIUS_M, QColor("#50c878")
-                )
-                ang = self._element_rotation(element)
-                item.set_angle_radians(ang)
-                rotation_handle.set_angle(ang)
-                rotation_handle.sync_to_angle()
-                handoff_visualizer = None
-            elif isinstance(element, EventTrigger):
-                kind = "event_trigger"
-                length_m = max(0.2, float(self.robot_width_m) * 0.6)
-                item = EventTriggerItem(
-                    self,
-                    QPointF(*pos),
-                    i,
-                    length_m=length_m,
-                    color=QColor("#ffd54d"),
-                )
-                item.set_angle_radians(self._event_trigger_angle_for_index(i))
-                rotation_handle = None
-                handoff_visualizer = None
-            elif isinstance(element, Waypoint):
-                kind = "waypoint"
-                item = RectElementItem(
-                    self,
-                    QPointF(*pos),
-                    i,
-                    filled_color=None,
-                    outline_color=QColor("#ff7f3a"),
-                    dashed_outline=False,
-                    triangle_color=QColor("#ff7f3a"),
-                )
-                rotation_handle = RotationHandle(
-                    self, item, HANDLE_DISTANCE_M, HANDLE_RADIUS_M, QColor("#ff7f3a")
+            reused = reusable.pop(key, None)
+            if reused is not None and reused[0] in keep:
+                item, rotation_handle = reused
+                self._update_reused_item(kind, element, i, pos, item, rotation_handle)
+            else:
+                created = self._create_element_items(kind, element, i, pos)
+                if created is None:
+                    continue
+                item, rotation_handle = created
+            handoff_visualizer = None
+            if kind == "translation":
+                handoff_visualizer = self._create_handoff_visualizer(
+                    element, i, last_index, pos, default_radius
                 )
-                ang = self._element_rotation(element)
-                item.set_angle_radians(ang)
-                rotation_handle.set_angle(ang)
-                rotation_handle.sync_to_angle()
-                handoff_visualizer = None
-                radius = getattr(
-                    element.translation_target, "intermediate_handoff_radius_meters", None
+            elif kind == "waypoint":
+                handoff_visualizer = self._create_handoff_visualizer(
+                    element.translation_target, i, last_index, pos, default_radius
                 )
-                if (
-                    (radius is None or radius <= 0)
-                    and hasattr(self, "_project_manager")
-                    and self._project_manager
-                ):
-                    try:
-                        default_radius = self._project_manager.get_default_optional_value(
-                            "intermediate_handoff_radius_meters"
-                        )
-                        if default_radius and default_radius > 0:
-                            radius = default_radius
-                    except Exception:
-                        pass
-                # Skip creating visualizer for the last element
-                if radius and radius > 0 and i != len(self._path.path_elements) - 1:
-                    hv = HandoffRadiusVisualizer(self, QPointF(*pos), radius)
-                    self.graphics_scene.addItem(hv)
-                    handoff_visualizer = hv
-            else:
-                continue
-            try:
-                self.graphics_scene.addItem(item)
-            except Exception:
-                continue
-            if rotation_handle:
-                for sub in rotation_handle.scene_items():
-                    try:
-                        self.graphics_scene.addItem(sub)
-                    except Exception:
-                        continue
             self._items.append((kind, item, rotation_handle))
+            self._item_keys.append(key)
             self._handoff_visualizers.append(handoff_visualizer)
         self._build_connecting_lines()
 
+    def _update_reused_item(self, kind, element, i, pos, item, rotation_handle):
+        item.index_in_model = i
+        self._suppress_live_events = True
+        try:
+            item.set_center_xy(pos[0], pos[1])
+        finally:
+            self._suppress_live_events = False
+        if kind == "event_trigger":
+            item.set_angle_radians(self._event_trigger_angle_for_index(i))
+        elif kind == "translation":
+            item.set_angle_radians(self._angle_for_translation_index(i))
+        else:
+            ang = self._element_rotation(element)
+            item.set_angle_radians(ang)
+            if rotation_handle:
+                rotation_handle.set_angle(ang)
+                rotation_handle.sync_to_angle()
+
+    def _create_element_items(self, kind, element, i, pos):
+        rotation_handle = None
+        if kind == "translation":
+            item = CircleElementItem(
+                self,
+                QPointF(*pos),
+                i,
+                filled_color=TRANSLATION_COLOR,
+                outline_color=TRANSLATION_COLOR,
+                dashed_outline=False,
+                triangle_color=None,
+            )
+            item.set_angle_radians(self._angle_for_translation_index(i))
+        elif kind == "event_trigger":
+            length_m = max(0.2, float(self.robot_width_m) * 0.6)
+            item = EventTriggerItem(
+                self,
+                QPointF(*pos),
+                i,
+                length_m=length_m,
+                color=EVENT_TRIGGER_COLOR,
+            )
+            item.set_angle_radians(self._event_trigger_angle_for_index(i))
+        else:
+            color = ROTATION_COLOR if kind == "rotation" else WAYPOINT_COLOR
+            item = RectElementItem(
+                self,
+                QPointF(*pos),
+                i,
+                filled_color=None,
+                outline_color=color,
+                dashed_outline=kind == "rotation",
+                triangle_color=color,
+            )
+            rotation_handle = RotationHandle(self, item, HANDLE_DISTANCE_M, HANDLE_RADIUS_M, color)
+            ang = self._element_rotation(element)
+            item.set_angle_radians(ang)
+            rotation_handle.set_angle(ang)
+            rotation_handle.sync_to_angle()
+        item.setParentItem(self._path_root)
+        # Pure translations reuse the device pixmap, so drags only re-blit the item
+        item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        if rotation_handle:
+            for sub in rotation_handle.scene_items():
+                sub.setParentItem(self._path_root)
+        return item, rotation_handle
+
+    def _default_handoff_radius(self) -> Optional[float]:
+        """Project-wide handoff radius default, or None when unset/non-positive."""
+        if not getattr(self, "_project_manager", None):
+            return None
+        try:
+            default_radius = self._project_manager.get_default_optional_value(
+                "intermediate_handoff_radius_meters"
+            )
+        except Exception:
+            return None
+        if default_radius and default_radius > 0:
+            return default_radius
+        return None
+
+    def _create_handoff_visualizer(self, target, i, last_index, pos, default_radius):
+        radius = getattr(target, "intermediate_handoff_radius_meters", None)
+        if radius is None or radius <= 0:
+            radius = default_radius
+        # Skip creating visualizer for the last element
+        if radius and radius > 0 and i != last_index:
+            hv = HandoffRadiusVisualizer(self, QPointF(*pos), radius)
+            hv.setParentItem(self._handoff_root)
+            return hv
+        return None
+
+    def _build_anchor_tables(self):
+        """Index the nearest anchor (translation target or waypoint) around each element.
+
+        Items are built one per path element, so the tables serve both model and scene lookups.
+        """
+        elements = self._path.path_elements if self._path is not None else []
+        count = len(elements)
+        kinds = [_KIND_BY_TYPE.get(type(el), _KIND_OTHER) for el in elements]
+        self._kind_for_index = kinds
+        is_anchor = [k == _KIND_TRANSLATION or k == _KIND_WAYPOINT for k in kinds]
+        self._translation_anchor_indices = [i for i in range(count) if is_anchor[i]]
+        self._rotation_anchor_indices = [
+            i for i, k in enumerate(kinds) if k == _KIND_ROTATION or k == _KIND_WAYPOINT
+        ]
+        self._projected_indices = [
+            i for i, k in enumerate(kinds) if k == _KIND_ROTATION or k == _KIND_EVENT_TRIGGER
+        ]
+        prev_of = [-1] * count
+        next_of = [-1] * count
+        last = -1
+        for i in range(count):
+            prev_of[i] = last
+            if is_anchor[i]:
+                last = i
+        last = -1
+        for i in range(count - 1, -1, -1):
+            next_of[i] = last
+            if is_anchor[i]:
+                last = i
+        self._prev_anchor_of = prev_of
+        self._next_anchor_of = next_of
+
     # ------------- Geometry helpers -------------
+    def _build_angle_table(self, start: int = 0):
+        """Refresh ``_angle_for_index`` from ``start`` onward (entries before it are reused)."""
+        elements = self._path.path_elements if self._path is not None else []
+        count = len(elements)
+        table = self._angle_for_index
+        if len(table) != count or start <= 0:
+            table = [0.0] * count
+            self._angle_for_index = table
+            start = 0
+        if start >= count:
+            return
+        kinds = self._kind_for_index
+        if len(kinds) != count:
+            kinds = [_KIND_BY_TYPE.get(type(el), _KIND_OTHER) for el in elements]
+        cur = table[start]
+        for i in range(start, count):
+            table[i] = cur
+            k = kinds[i]
+            if k == _KIND_ROTATION:
+                cur = float(elements[i].rotation_radians)
+            elif k == _KIND_WAYPOINT:
+                cur = float(elements[i].rotation_target.rotation_radians)
+
     def _angle_for_translation_index(self, index: int) -> float:
         if self._path is None or index <= 0:
             return 0.0
+        if index < len(self._angle_for_index):
+            return self._angle_for_index[index]
         for i in range(index - 1, -1, -1):
             el = self._path.path_elements[i]
             if isinstance(el, (RotationTarget, Waypoint)):
@@ -529,9 +769,13 @@ class CanvasView(QGraphicsView):
         if self._path is None or index < 0 or index >= len(self._path.path_elements):
             return 0.0, 0.0
         element = self._path.path_elements[index]
-        if isinstance(element, (TranslationTarget, Waypoint)):
+        if len(self._kind_for_index) == len(self._path.path_elements):
+            k = self._kind_for_index[index]
+        else:
+            k = _KIND_BY_TYPE.get(type(element), _KIND_OTHER)
+        if k == _KIND_TRANSLATION or k == _KIND_WAYPOINT:
             return _get_translation_position(element)
-        if isinstance(element, (RotationTarget, EventTrigger)):
+        if k == _KIND_ROTATION or k == _KIND_EVENT_TRIGGER:
             prev_pos, next_pos = self._neighbor_positions_model(index)
             if prev_pos is None or next_pos is None:
                 return 0.0, 0.0
@@ -547,6 +791,14 @@ class CanvasView(QGraphicsView):
     ) -> Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]:
         if self._path is None:
             return None, None
+        elements = self._path.path_elements
+        if 0 <= index < len(elements) and len(self._prev_anchor_of) == len(elements):
+            prev_i = self._prev_anchor_of[index]
+            next_i = self._next_anchor_of[index]
+            return (
+                _get_translation_position(elements[prev_i]) if prev_i >= 0 else None,
+                _get_translation_position(elements[next_i]) if next_i >= 0 else None,
+            )
         prev_pos = None
         for i in range(index - 1, -1, -1):
             e = self._path.path_elements[i]
@@ -580,54 +832,68 @@ class CanvasView(QGraphicsView):
         return angle + (math.pi / 2.0)
 
     def _build_connecting_lines(self):
-        self._connect_lines = []
-        if not self._items:
-            return
-        for i in range(len(self._items) - 1):
-            try:
-                _, a, _ = self._items[i]
-                _, b, _ = self._items[i + 1]
-                if a and b:
-                    line = QGraphicsLineItem(a.pos().x(), a.pos().y(), b.pos().x(), b.pos().y())
-                    line.setPen(QPen(QColor("#cccccc"), CONNECT_LINE_THICKNESS_M))
-                    line.setZValue(5)
-                    self.graphics_scene.addItem(line)
-                    self._connect_lines.append(line)
-            except Exception:
-                continue
+        self._update_connecting_lines()
 
     def _update_connecting_lines(self):
-        if not self._items or not self._connect_lines:
-            return
-        for i in range(len(self._connect_lines)):
-            if i >= len(self._items) - 1:
-                break
-            try:
-                _, a, _ = self._items[i]
-                _, b, _ = self._items[i + 1]
-                if a and b:
-                    self._connect_lines[i].setLine(
-                        a.pos().x(), a.pos().y(), b.pos().x(), b.pos().y()
-                    )
-            except Exception:
-                continue
+        path = QPainterPath()
+        prev = None
+        for _, item, _ in self._items:
+            pos = item.pos()
+            if prev is not None:
+                # Separate subpaths keep the per-segment square caps of the original lines
+                path.moveTo(prev)
+                path.lineTo(pos)
+            prev = pos
+        self._connect_path_item.setPath(path)
 
     # -------- Live interactions --------
+    def _queue_live_move(self, index: int, x_m: float, y_m: float):
+        self._pending_live_moves[index] = (x_m, y_m)
+        if not self._live_move_timer.isActive():
+            self._live_move_timer.start()
+
+    def _flush_live_moves(self):
+        self._live_move_timer.stop()
+        if not self._pending_live_moves:
+            return
+        pending = self._pending_live_moves
+        self._pending_live_moves = {}
+        for index, (x_m, y_m) in pending.items():
+            self._on_item_live_moved(index, x_m, y_m)
+
+    def _begin_drag_frame(self):
+        if not self._drag_viewport_batching:
+            self._drag_viewport_batching = True
+            self.setViewportUpdateMode(QGraphicsView.NoViewportUpdate)
+        if not self._drag_frame_pending:
+            self._drag_frame_pending = True
+            QTimer.singleShot(0, self._flush_drag_frame)
+
+    def _flush_drag_frame(self):
+        self._drag_frame_pending = False
+        if QGuiApplication.mouseButtons() == Qt.NoButton:
+            # Moves not driven by a mouse drag never get a release; don't stay batched
+            self._end_drag_viewport_batching()
+            return
+        self.viewport().update()
+
+    def _end_drag_viewport_batching(self):
+        if not self._drag_viewport_batching:
+            return
+        self._drag_viewport_batching = False
+        self.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
+        self.viewport().update()
+
     def _on_item_live_moved(self, index: int, x_m: float, y_m: float):
         if index < 0 or index >= len(self._items):
             return
+        self._begin_drag_frame()
         self._update_connecting_lines()
-        try:
-            kind, _, handle = self._items[index]
-            if handle:
-                handle.sync_to_angle()
-        except Exception:
-            return
+        kind, _, handle = self._items[index]
+        if handle:
+            handle.sync_to_angle()
         if index < len(self._handoff_visualizers) and self._handoff_visualizers[index]:
-            try:
-                self._handoff_visualizers[index].set_center(QPointF(x_m, y_m))
-            except Exception:
-                pass
+            self._handoff_visualizers[index].set_center_xy(x_m, y_m)
         self.elementMoved.emit(index, x_m, y_m)
         if kind in ("translation", "waypoint"):
             self._reproject_rotation_items_in_scene()
@@ -636,6 +902,7 @@ class CanvasView(QGraphicsView):
     def _on_item_live_rotated(self, index: int, angle_radians: float):
         if index < 0 or index >= len(self._items):
             return
+        self._begin_drag_frame()
         try:
             kind, item, handle = self._items[index]
             if kind in ("rotation", "waypoint"):
@@ -645,7 +912,10 @@ class CanvasView(QGraphicsView):
         except Exception:
             return
         self.elementRotated.emit(index, angle_radians)
-        for j, (k, it, _) in enumerate(self._items):
+        # Only translation items after the rotated element can change heading
+        self._build_angle_table(index)
+        for j in range(index + 1, len(self._items)):
+            k, it, _ = self._items[j]
             if k == "translation":
                 try:
                     it.set_angle_radians(self._angle_for_translation_index(j))
@@ -662,7 +932,8 @@ class CanvasView(QGraphicsView):
         
         For 2026 field, adds FIELD_OFFSET_M (0.5m) to account for image margin.
         """
-        return QPointF(x_m + self._field_offset, FIELD_WIDTH_METERS - y_m - self._field_offset)
+        sx, sy, tx, ty = self._affine
+        return QPointF(sx * x_m + tx, sy * y_m + ty)
 
     def _model_from_scene(self, x_s: float, y_s: float) -> Tuple[float, float]:
         """Convert scene coordinates to model coordinates.
@@ -680,12 +951,9 @@ class CanvasView(QGraphicsView):
         x_s, y_s = self._clamp_scene_coords(x_s, y_s)
         if index < 0 or index >= len(self._items):
             return x_s, y_s
-        try:
-            kind, _, _ = self._items[index]
-        except Exception:
-            return x_s, y_s
-        if kind not in ("rotation", "event_trigger"):
+        if self._items[index][0] not in ("rotation", "event_trigger"):
             return x_s, y_s
+        # O(1): neighbour indices come from the tables built with the items
         prev_pos, next_pos = self._find_neighbor_item_positions(index)
         if prev_pos is None or next_pos is None:
             return x_s, y_s
@@ -705,69 +973,97 @@ class CanvasView(QGraphicsView):
     def _find_neighbor_item_positions(
         self, index: int
     ) -> Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]:
+        if index < 0 or index >= len(self._prev_anchor_of) or index >= len(self._items):
+            return None, None
         prev_pos = None
-        for i in range(index - 1, -1, -1):
-            try:
-                kind, item, _ = self._items[i]
-                if kind in ("translation", "waypoint"):
-                    prev_pos = (item.pos().x(), item.pos().y())
-                    break
-            except Exception:
-                continue
+        prev_i = self._prev_anchor_of[index]
+        if prev_i >= 0:
+            pos = self._items[prev_i][1].pos()
+            prev_pos = (pos.x(), pos.y())
         next_pos = None
-        for i in range(index + 1, len(self._items)):
-            try:
-                kind, item, _ = self._items[i]
-                if kind in ("translation", "waypoint"):
-                    next_pos = (item.pos().x(), item.pos().y())
-                    break
-            except Exception:
-                continue
+        next_i = self._next_anchor_of[index]
+        if 0 <= next_i < len(self._items):
+            pos = self._items[next_i][1].pos()
+            next_pos = (pos.x(), pos.y())
         return prev_pos, next_pos
 
     def _reproject_rotation_items_in_scene(self):
+        # Drag moves can arrive several times per event-loop pass; project once per pass
+        if self._reproject_pending:
+            return
+        self._reproject_pending = True
+        QTimer.singleShot(0, self._flush_reproject)
+
+    def _flush_reproject(self):
+        if not self._reproject_pending:
+            return
+        self._reproject_pending = False
+        self._reproject_now()
+
+    def _reproject_now(self):
+        self._reproject_pending = False
         self._suppress_live_events = True
         try:
-            for i, (kind, item, handle) in enumerate(self._items):
+            # Anchors don't move during reprojection; read each anchor's scene position once
+            anchor_xy = self._anchor_scene_positions()
+            prev_of = self._prev_anchor_of
+            next_of = self._next_anchor_of
+            elements = self._path.path_elements if self._path else []
+            count = min(len(self._items), len(prev_of), len(elements))
+            for i in self._projected_indices:
+                if i >= count:
+                    break
+                kind, item, handle = self._items[i]
                 if kind not in ("rotation", "event_trigger"):
                     continue
-                prev_pos, next_pos = self._find_neighbor_item_positions(i)
+                prev_pos = anchor_xy.get(prev_of[i])
+                next_pos = anchor_xy.get(next_of[i])
                 if prev_pos is None or next_pos is None:
                     continue
                 ax, ay = prev_pos
                 bx, by = next_pos
                 t = 0.0
-                try:
-                    if self._path and i < len(self._path.path_elements):
-                        rt = self._path.path_elements[i]
-                        if isinstance(rt, (RotationTarget, EventTrigger)):
-                            t = float(getattr(rt, "t_ratio", 0.0))
-                except Exception:
-                    t = 0.0
+                rt = elements[i]
+                if isinstance(rt, (RotationTarget, EventTrigger)):
+                    t = float(rt.t_ratio or 0.0)
                 t = max(0.0, min(1.0, t))
-                proj_x = ax + t * (bx - ax)
-                proj_y = ay + t * (by - ay)
-                try:
-                    item.setPos(proj_x, proj_y)
-                except Exception:
-                    continue
+                item.setPos(ax + t * (bx - ax), ay + t * (by - ay))
                 if kind == "event_trigger":
-                    try:
-                        item.set_angle_radians(self._event_trigger_angle_for_index(i))
-                    except Exception:
-                        pass
+                    item.set_angle_radians(self._event_trigger_angle_for_index(i))
                 if handle:
                     handle.sync_to_angle()
             self._update_connecting_lines()
         finally:
             self._suppress_live_events = False
+            self._flush_pending_simulation_rebuild()
+
+    def _anchor_scene_positions(self) -> dict[int, Tuple[float, float]]:
+        anchor_xy: dict[int, Tuple[float, float]] = {}
+        items = self._items
+        for j in self._translation_anchor_indices:
+            if j >= len(items):
+                break
+            kind, item, _ = items[j]
+            if kind in ("translation", "waypoint"):
+                pos = item.pos()
+                anchor_xy[j] = (pos.x(), pos.y())
+        return anchor_xy
 
     def _compute_rotation_t_cache(self) -> dict[int, float]:
         t_by_index = {}
-        for i, (kind, item, _) in enumerate(self._items):
-            if kind not in ("rotation", "event_trigger"):
-                continue
-            prev_pos, next_pos = self._find_neighbor_item_positions(i)
+        # Read each anchor's scene position once rather than once per neighbouring rotation
+        anchor_xy = self._anchor_scene_positions()
+        prev_of = self._prev_anchor_of
+        next_of = self._next_anchor_of
+        items = self._items
+        count = min(len(items), len(prev_of))
+        # _projected_indices already holds only the rotation and event-trigger positions
+        for i in self._projected_indices:
+            if i >= count:
+                break
+            item = items[i][1]
+            prev_pos = anchor_xy.get(prev_of[i])
+            next_pos = anchor_xy.get(next_of[i])
             if prev_pos is None or next_pos is None:
                 continue
             ax, ay = prev_pos
@@ -777,8 +1073,8 @@ class CanvasView(QGraphicsView):
             denom = dx * dx + dy * dy
             if denom <= 0:
                 continue
-            rx, ry = item.pos().x(), item.pos().y()
-            t = ((rx - ax) * dx + (ry - ay) * dy) / denom
+            pos = item.pos()
+            t = ((pos.x() - ax) * dx + (pos.y() - ay) * dy) / denom
             t = max(0.0, min(1.0, t))
             t_by_index[i] = float(t)
         return t_by_index
@@ -792,13 +1088,24 @@ class CanvasView(QGraphicsView):
             self._rotation_t_cache = self._compute_rotation_t_cache()
 
     def _on_item_released(self, index: int):
+        # Deliver the final drag position before reporting the drag as finished
+        self._flush_live_moves()
+        self._flush_reproject()
+        self._end_drag_viewport_batching()
         if self._anchor_drag_in_progress:
             try:
-                for i, (kind, item, _) in enumerate(self._items):
-                    if kind not in ("rotation", "event_trigger"):
-                        continue
-                    mx, my = self._model_from_scene(item.pos().x(), item.pos().y())
-                    self.elementMoved.emit(i, mx, my)
+                indices, xs, ys = [], [], []
+                items = self._items
+                for i in self._projected_indices:
+                    if i >= len(items):
+                        break
+                    pos = items[i][1].pos()
+                    mx, my = self._model_from_scene(pos.x(), pos.y())
+                    indices.append(i)
+                    xs.append(mx)
+                    ys.append(my)
+                if indices:
+                    self.elementsMoved.emit(indices, xs, ys)
             finally:
                 self._anchor_drag_in_progress = False
                 self._rotation_t_cache = None
@@ -807,10 +1114,24 @@ class CanvasView(QGraphicsView):
 
     # -------- Simulation API (subset) --------
     def request_simulation_rebuild(self):
-        try:
-            self._sim_debounce.start()
-        except Exception:
-            pass
+        if self._suppress_live_events:
+            self._sim_rebuild_pending = True
+            return
+        self._start_sim_debounce()
+
+    def _flush_pending_simulation_rebuild(self):
+        if self._sim_rebuild_pending:
+            self._sim_rebuild_pending = False
+            self._start_sim_debounce()
+
+    def _start_sim_debounce(self):
+        # Wait longer while an anchor is being dragged so edits do not queue up behind
+        # simulation runs; the release requests one more rebuild at the short interval
+        if self._anchor_drag_in_progress:
+            self._sim_debounce.setInterval(SIMULATION_DRAG_DEBOUNCE_INTERVAL_MS)
+        else:
+            self._sim_debounce.setInterval(SIMULATION_DEBOUNCE_INTERVAL_MS)
+        self._sim_debounce.start()
 
     def _ensure_sim_robot_item(self):
         try:
@@ -846,11 +1167,13 @@ class CanvasView(QGraphicsView):
 
     def _clear_trail(self):
         try:
-            for line in self._trail_lines:
-                if line.scene():
-                    self.graphics_scene.removeItem(line)
-            self._trail_lines.clear()
             self._trail_points.clear()
+            self._trail_scene_points = []
+            self._trail_drawn_index = 0
+            self._trail_path = QPainterPath()
+            if self._trail_path_item is not None:
+                self._trail_path_item.setPath(self._trail_path)
+                self._trail_path_item.setVisible(False)
         except Exception:
             pass
 
@@ -858,34 +1181,42 @@ class CanvasView(QGraphicsView):
         try:
             self._clear_trail()
             self._trail_points = trail_points.copy()
-            orange_pen = QPen(QColor(255, 165, 0), 0.05)
-            orange_pen.setCapStyle(Qt.RoundCap)
-            for i in range(len(self._trail_points) - 1):
-                line = QGraphicsLineItem()
-                line.setPen(orange_pen)
-                line.setZValue(14)
-                line.setVisible(False)
-                self.graphics_scene.addItem(line)
-                self._trail_lines.append(line)
+            # Apply the fixed model->scene affine inline; the trail can hold thousands of samples
+            sx, sy, tx, ty = self._affine
+            self._trail_scene_points = [QPointF(sx * x + tx, sy * y + ty) for x, y in trail_points]
+            if self._trail_path_item is None:
+                orange_pen = QPen(QColor(255, 165, 0), 0.05)
+                orange_pen.setCapStyle(Qt.RoundCap)
+                orange_pen.setJoinStyle(Qt.RoundJoin)
+                self._trail_path_item = QGraphicsPathItem()
+                self._trail_path_item.setPen(orange_pen)
+                self._trail_path_item.setZValue(14)
+                self._trail_path_item.setVisible(False)
+                self.graphics_scene.addItem(self._trail_path_item)
         except Exception:
             pass
 
     def _update_trail_visibility(self, current_index: int):
-        try:
-            if not self._trail_points or not self._trail_lines:
-                return
-            for i, line in enumerate(self._trail_lines):
-                if i < current_index and i < len(self._trail_points) - 1:
-                    x1, y1 = self._trail_points[i]
-                    x2, y2 = self._trail_points[i + 1]
-                    p1 = self._scene_from_model(x1, y1)
-                    p2 = self._scene_from_model(x2, y2)
-                    line.setLine(p1.x(), p1.y(), p2.x(), p2.y())
-                    line.setVisible(True)
-                else:
-                    line.setVisible(False)
-        except Exception:
-            pass
+        if not self._trail_scene_points or self._trail_path_item is None:
+            return
+        # The trail shows points 0..current_index as one polyline
+        end = min(current_index, len(self._trail_scene_points) - 1)
+        if end <= 0:
+            self._trail_drawn_index = 0
+            self._trail_path = QPainterPath()
+            self._trail_path_item.setVisible(False)
+            return
+        points = self._trail_scene_points
+        if end < self._trail_drawn_index or self._trail_drawn_index == 0:
+            # Seeking backwards (or starting over) redraws from the first sample in one call
+            self._trail_path = QPainterPath()
+            self._trail_path.addPolygon(QPolygonF(points[: end + 1]))
+        else:
+            for i in range(self._trail_drawn_index + 1, end + 1):
+                self._trail_path.lineTo(points[i])
+        self._trail_drawn_index = end
+        self._trail_path_item.setPath(self._trail_path)
+        self._trail_path_item.setVisible(True)
 
     # Transport control callbacks (public subset kept for TransportControls wiring)
     def _toggle_play_pause(self):
@@ -914,8 +1245,14 @@ class CanvasView(QGraphicsView):
             pass
 
     def _on_slider_changed(self, value: int):
+        self._sim_current_time_s = float(value) / 10000.0
+        # Not restarted while running, so a continuous drag still seeks every interval
+        if not self._seek_throttle.isActive():
+            self._seek_throttle.start()
+
+    def _flush_slider_seek(self):
+        self._seek_throttle.stop()
         try:
-            self._sim_current_time_s = float(value) / 10000.0
             self._seek_to_time(self._sim_current_time_s)
             self._update_sim_robot_visibility()
         except Exception:
@@ -932,57 +1269,53 @@ class CanvasView(QGraphicsView):
             pass
 
     def _on_slider_released(self):
-        pass
+        # Land exactly on the released value without waiting for the throttle
+        if self._seek_throttle.isActive():
+            self._flush_slider_seek()
 
     def _seek_to_time(self, t_s: float):
-        try:
-            if not self._sim_times_sorted or not self._sim_poses_by_time:
-                return
-            key_index = 0
-            key = 0.0
-            for i, tk in enumerate(self._sim_times_sorted):
-                if tk <= t_s:
-                    key = tk
-                    key_index = i
-                else:
-                    break
-            x, y, th = self._sim_poses_by_time.get(
-                key, self._sim_poses_by_time[self._sim_times_sorted[0]]
+        result = self._sim_result
+        if result is None or not self._sim_times_sorted:
+            return
+        key_index = result.sample_index_at(t_s)
+        # Seeks that land on the same sample leave the robot and trail as they are
+        if key_index != self._last_seek_index:
+            self._last_seek_index = key_index
+            self._set_sim_robot_pose(
+                result.pose_x_m[key_index],
+                result.pose_y_m[key_index],
+                result.pose_theta_rad[key_index],
             )
-            self._set_sim_robot_pose(x, y, th)
             self._update_trail_visibility(key_index)
-            if self.transport.label:
-                self.transport.label.setText(f"{t_s:.2f} / {self._sim_total_time_s:.2f} s")
-            self._update_sim_robot_visibility()
-        except Exception:
-            pass
+        label_text = f"{t_s:.2f} / {self._sim_total_time_s:.2f} s"
+        if self.transport.label and label_text != self._last_time_label:
+            self._last_time_label = label_text
+            self.transport.label.setText(label_text)
+        self._update_sim_robot_visibility()
 
     def _on_sim_tick(self):
-        try:
-            if not self._sim_times_sorted:
-                self._sim_timer.stop()
-                if self.transport.btn:
-                    self.transport.btn.setText("▶")
-                    return
-            self._sim_current_time_s += 0.02
-            if self._sim_current_time_s >= self._sim_total_time_s:
-                self._sim_current_time_s = self._sim_total_time_s
-                self._sim_timer.stop()
-                if self.transport.btn:
-                    self.transport.btn.setText("▶")
-            if self.transport.slider:
-                self.transport.slider.blockSignals(True)
-                self.transport.slider.setValue(int(round(self._sim_current_time_s * 10000.0)))
-                self.transport.slider.blockSignals(False)
-            self._seek_to_time(self._sim_current_time_s)
-        except Exception:
-            pass
+        if not self._sim_times_sorted:
+            self._sim_timer.stop()
+            if self.transport.btn:
+                self.transport.btn.setText("▶")
+                return
+        self._sim_current_time_s += 0.02
+        if self._sim_current_time_s >= self._sim_total_time_s:
+            self._sim_current_time_s = self._sim_total_time_s
+            self._sim_timer.stop()
+            if self.transport.btn:
+                self.transport.btn.setText("▶")
+        if self.transport.slider:
+            self.transport.slider.blockSignals(True)
+            self.transport.slider.setValue(int(round(self._sim_current_time_s * 10000.0)))
+            self.transport.slider.blockSignals(False)
+        self._seek_to_time(self._sim_current_time_s)
 
     def _set_sim_robot_pose(self, x_m: float, y_m: float, theta_rad: float):
         try:
             if not self._sim_robot_item:
                 return
-            self._sim_robot_item.set_center(QPointF(x_m, y_m))
+            self._sim_robot_item.set_center_xy(x_m, y_m)
             self._sim_robot_item.set_angle_radians(theta_rad)
         except Exception:
             pass
@@ -990,8 +1323,9 @@ class CanvasView(QGraphicsView):
     def _rebuild_simulation_now(self):
         try:
             if self._path is None:
+                self._last_seek_index = -1
+                self._last_time_label = ""
                 self._sim_result = None
-                self._sim_poses_by_time = {}
                 self._sim_times_sorted = []
                 self._sim_total_time_s = 0.0
                 self._sim_current_time_s = 0.0
@@ -1013,8 +1347,13 @@ class CanvasView(QGraphicsView):
             except Exception:
                 cfg = {}
             result = simulate_path(self._path, cfg, dt_s=0.001)
+            # simulate_path memoizes by input content, so an edit that changed nothing the
+            # simulation reads returns the current result; keep the playback state as is
+            if result is self._sim_result:
+                return
+            self._last_seek_index = -1
+            self._last_time_label = ""
             self._sim_result = result
-            self._sim_poses_by_time = result.poses_by_time
             self._sim_times_sorted = result.times_sorted
             self._sim_total_time_s = float(result.total_time_s)
             self._sim_current_time_s = 0.0
@@ -1026,9 +1365,9 @@ class CanvasView(QGraphicsView):
             if self.transport.label:
                 self.transport.label.setText(f"0.00 / {self._sim_total_time_s:.2f} s")
             if self._sim_robot_item and self._sim_times_sorted:
-                t0 = self._sim_times_sorted[0]
-                x, y, th = self._sim_poses_by_time.get(t0, (0.0, 0.0, 0.0))
-                self._set_sim_robot_pose(x, y, th)
+                self._set_sim_robot_pose(
+                    result.pose_x_m[0], result.pose_y_m[0], result.pose_theta_rad[0]
+                )
                 self._update_sim_robot_visibility()
             if hasattr(result, "trail_points") and result.trail_points:
                 self._setup_trail(result.trail_points)
@@ -1053,46 +1392,38 @@ class CanvasView(QGraphicsView):
         super().keyPressEvent(event)
 
     def wheelEvent(self, event):
-        try:
-            delta_y = 0
-            delta = event.angleDelta()
-            if delta:
-                delta_y = int(delta.y())
-            if delta_y == 0:
-                pdelta = event.pixelDelta()
-                if pdelta:
-                    delta_y = int(pdelta.y())
-            if delta_y == 0:
-                return super().wheelEvent(event)
-            zoom_step = ZOOM_STEP_FACTOR
-            factor = zoom_step if delta_y > 0 else (1.0 / zoom_step)
-            new_zoom = self._zoom_factor * factor
-            if new_zoom < self._min_zoom:
-                if self._zoom_factor <= self._min_zoom:
-                    return
-                factor = self._min_zoom / self._zoom_factor
-                self._zoom_factor = self._min_zoom
-            elif new_zoom > self._max_zoom:
-                if self._zoom_factor >= self._max_zoom:
-                    return
-                factor = self._max_zoom / self._zoom_factor
-                self._zoom_factor = self._max_zoom
-            else:
-                self._zoom_factor = new_zoom
-            self.scale(factor, factor)
-            event.accept()
-            # Keep transport overlay anchored after zooming
-            try:
-                self.transport.position()
-            except Exception:
-                pass
-        except Exception:
-            try:
-                super().wheelEvent(event)
-            except Exception:
-                pass
+        delta_y = 0
+        delta = event.angleDelta()
+        if delta:
+            delta_y = int(delta.y())
+        if delta_y == 0:
+            pdelta = event.pixelDelta()
+            if pdelta:
+                delta_y = int(pdelta.y())
+        if delta_y == 0:
+            return super().wheelEvent(event)
+        zoom_step = ZOOM_STEP_FACTOR
+        factor = zoom_step if delta_y > 0 else (1.0 / zoom_step)
+        new_zoom = self._zoom_factor * factor
+        if new_zoom < self._min_zoom:
+            if self._zoom_factor <= self._min_zoom:
+                return
+            factor = self._min_zoom / self._zoom_factor
+            self._zoom_factor = self._min_zoom
+        elif new_zoom > self._max_zoom:
+            if self._zoom_factor >= self._max_zoom:
+                return
+            factor = self._max_zoom / self._zoom_factor
+            self._zoom_factor = self._max_zoom
+        else:
+            self._zoom_factor = new_zoom
+        self.scale(factor, factor)
+        event.accept()
+        # Keep transport overlay anchored after zooming
+        self.transport.position()
 
     def _on_rotation_handle_released(self, index: int):
+        self._end_drag_viewport_batching()
         try:
             self.rotationDragFinished.emit(int(index))
         except Exception:
@@ -1107,13 +1438,13 @@ class CanvasView(QGraphicsView):
             item = self.itemAt(pos)
             if item is None:
                 return True
+            # Neither class is subclassed here, so an exact type check suffices
+            item_type = type(item)
             # Avoid panning when clicking the transport overlay
-            from PySide6.QtWidgets import QGraphicsPixmapItem, QGraphicsProxyWidget
-
-            if isinstance(item, QGraphicsProxyWidget):
+            if item_type is QGraphicsProxyWidget:
                 return False
             # Allow panning when clicking the background pixmap
-            if isinstance(item, QGraphicsPixmapItem):
+            if item_type is QGraphicsPixmapItem:
                 return True
             # Otherwise, assume it's an interactive scene item; don't pan
             return False
@@ -1134,35 +1465,35 @@ class CanvasView(QGraphicsView):
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
-        try:
-            if self._is_panning and self._pan_start is not None:
-                delta = event.pos() - self._pan_start
-                hbar = self.horizontalScrollBar()
-                vbar = self.verticalScrollBar()
+        if self._is_panning and self._pan_start is not None:
+            delta = event.pos() - self._pan_start
+            hbar = self.horizontalScrollBar()
+            vbar = self.verticalScrollBar()
+            # Both scrollbars scroll the view; re-anchor the overlay once afterwards
+            self._defer_overlay_reposition = True
+            try:
                 hbar.setValue(hbar.value() - delta.x())
                 vbar.setValue(vbar.value() - delta.y())
-                self._pan_start = event.pos()
-                event.accept()
-                return
-        except Exception:
-            pass
-        super().mouseMoveEvent(event)
-
-        # Reposition overlay when the view scrolls due to any movement
-        try:
+            finally:
+                self._defer_overlay_reposition = False
             self.transport.position()
-        except Exception:
-            pass
+            self._pan_start = event.pos()
+            event.accept()
+            return
+        # Any scroll caused by the move goes through scrollContentsBy, which re-anchors
+        # the overlay, so plain hover moves leave it alone
+        super().mouseMoveEvent(event)
 
     def scrollContentsBy(self, dx: int, dy: int):
         # Called for any programmatic or inertial scroll; keep overlay anchored
         try:
             super().scrollContentsBy(dx, dy)
         finally:
-            try:
-                self.transport.position()
-            except Exception:
-                pass
+            if not self._defer_overlay_reposition:
+                try:
+                    self.transport.position()
+                except Exception:
+                    pass
 
     def mouseReleaseEvent(self, event):
         try:
@@ -1175,6 +1506,8 @@ class CanvasView(QGraphicsView):
         except Exception:
             pass
         super().mouseReleaseEvent(event)
+        # Item releases end drag batching themselves; this covers a grabber lost mid-drag
+        self._end_drag_viewport_batching()
 
     # ---- Constraint overlay (kept simplified pass-through) ----
     def clear_constraint_range_overlay(self):
@@ -1193,11 +1526,57 @@ class CanvasView(QGraphicsView):
 
         if not self._range_overlay_lines:
             return
+        # Hide rather than remove so the next preview reuses the items
         for line in self._range_overlay_lines:
-            if line and line.scene():
-                self.graphics_scene.removeItem(line)
+            line.setVisible(False)
         self._range_overlay_lines.clear()
 
+    def _add_range_overlay_line(self, a: QPointF, b: QPointF):
+        in_use = len(self._range_overlay_lines)
+        if in_use < len(self._range_overlay_pool):
+            line = self._range_overlay_pool[in_use]
+            line.setLine(a.x(), a.y(), b.x(), b.y())
+            line.setVisible(True)
+        else:
+            line = QGraphicsLineItem(a.x(), a.y(), b.x(), b.y())
+            line.setPen(RANGE_OVERLAY_PEN)
+            line.setZValue(25)
+            self.graphics_scene.addItem(line)
+            self._range_overlay_pool.append(line)
+        self._range_overlay_lines.append(line)
+
+    def _draw_range_overlay_segments(self, anchor_indices: List[int], lo: int, hi: int):
+        """Draw the overlay along the path from anchor ordinal lo to hi (1-based).
+
+        The segment leading into the first selected anchor is included, so a range
+        that starts after the first anchor still shows where it begins.
+        """
+        if not anchor_indices:
+            return
+        lo = max(1, min(int(lo), len(anchor_indices)))
+        hi = max(1, min(int(hi), len(anchor_indices)))
+        if lo > hi:
+            lo, hi = hi, lo
+        start_anchor_i = lo - 2 if lo > 1 else lo - 1
+        start_global = anchor_indices[start_anchor_i]
+        end_global = anchor_indices[hi - 1]
+        if start_global > end_global:
+            start_global, end_global = end_global, start_global
+        items = self._items
+        end_global = min(end_global, len(items) - 1)
+        start_global = max(start_global, 0)
+        if start_global >= end_global:
+            return
+        # Each interior position ends one segment and starts the next, so read it once
+        prev_item = items[start_global][1]
+        prev_pos = prev_item.pos() if prev_item is not None else None
+        for j in range(start_global + 1, end_global + 1):
+            item = items[j][1]
+            pos = item.pos() if item is not None else None
+            if prev_pos is not None and pos is not None:
+                self._add_range_overlay_line(prev_pos, pos)
+            prev_pos = pos
+
     def show_constraint_range_overlay(self, key: str, start_ordinal: int, end_ordinal: int):
         # Simplified placeholder: leaving original logic in monolithic file for now.
         # Future work: Extract overlay-building logic similarly.
@@ -1208,23 +1587,14 @@ class CanvasView(QGraphicsView):
         rotation_keys = ("max_velocity_deg_per_sec", "max_acceleration_deg_per_sec2")
         is_rotation_domain = key in rotation_keys
         if is_rotation_domain:
-            anchors = [
-                (i, it)
-                for i, (k, it, _h) in enumerate(self._items)
-                if k in ("rotation", "waypoint")
-            ]
+            domain_indices = self._rotation_anchor_indices
         else:
-            anchors = [
-                (i, it)
-                for i, (k, it, _h) in enumerate(self._items)
-                if k in ("translation", "waypoint")
-            ]
+            domain_indices = self._translation_anchor_indices
+        anchors = [(i, self._items[i][1]) for i in domain_indices if i < len(self._items)]
         if not anchors:
             return
         lo = int(min(start_ordinal, end_ordinal))
         hi = int(max(start_ordinal, end_ordinal))
-        green_pen = QPen(QColor("#15c915"), CONNECT_LINE_THICKNESS_M)
-        green_pen.setCapStyle(Qt.RoundCap)
         if lo < 1:
             lo = 1
         if hi > len(anchors):
@@ -1234,10 +1604,7 @@ class CanvasView(QGraphicsView):
             try:
                 first_item = None
                 if is_rotation_domain:
-                    for kind, it, _h in self._items:
-                        if kind in ("rotation", "waypoint"):
-                            first_item = it
-                            break
+                    first_item = anchors[0][1]
                 else:
                     if self._items and len(self._items) > 0 and len(self._items[0]) > 1:
                         first_item = self._items[0][1]
@@ -1256,7 +1623,7 @@ class CanvasView(QGraphicsView):
                     # Apply green highlight
                     try:
                         hl_pen = QPen(
-                            QColor("#15c915"),
+                            RANGE_HIGHLIGHT_COLOR,
                             (
                                 old_pen.widthF()
                                 if hasattr(old_pen, "widthF")
@@ -1277,79 +1644,9 @@ class CanvasView(QGraphicsView):
                             and first_item.brush()
                             and first_item.brush().style() != Qt.NoBrush
                         ):
-                            first_item.setBrush(QBrush(QColor("#15c915")))
+                            first_item.setBrush(QBrush(RANGE_HIGHLIGHT_COLOR))
                     except Exception:
                         pass
             except Exception:
                 pass
-        if is_rotation_domain:
-            # Map rotation-domain ordinals to global path indices and draw along every segment in between
-            rot_indices = [
-                idx for idx, (k, _it, _h) in enumerate(self._items) if k in ("rotation", "waypoint")
-            ]
-            if not rot_indices:
-                return
-            lo = max(1, min(int(lo), len(rot_indices)))
-            hi = max(1, min(int(hi), len(rot_indices)))
-            if lo > hi:
-                lo, hi = hi, lo
-            start_anchor_i = lo - 1
-            if lo > 1:
-                start_anchor_i = (
-                    lo - 2
-                )  # include the segment leading into the first selected anchor
-            end_anchor_i = hi - 1
-            start_global = rot_indices[start_anchor_i]
-            end_global = rot_indices[end_anchor_i]
-            if start_global > end_global:
-                start_global, end_global = end_global, start_global
-            # Draw contiguous segments along the path between these global indices
-            for j in range(start_global, end_global):
-                if j < 0 or j + 1 >= len(self._items):
-                    break
-                try:
-                    _k1, a, _h1 = self._items[j]
-                    _k2, b, _h2 = self._items[j + 1]
-                    if a is None or b is None:
-                        continue
-                    line = QGraphicsLineItem(a.pos().x(), a.pos().y(), b.pos().x(), b.pos().y())
-                    line.setPen(green_pen)
-                    line.setZValue(25)
-                    self.graphics_scene.addItem(line)
-                    self._range_overlay_lines.append(line)
-                except Exception:
-                    continue
-            return
-        # Translation-domain anchors: mirror rotation logic by mapping ordinal anchors to global indices
-        tr_indices = [
-            idx for idx, (k, _it, _h) in enumerate(self._items) if k in ("translation", "waypoint")
-        ]
-        if not tr_indices:
-            return
-        lo = max(1, min(int(lo), len(tr_indices)))
-        hi = max(1, min(int(hi), len(tr_indices)))
-        if lo > hi:
-            lo, hi = hi, lo
-        start_anchor_i = lo - 1
-        if lo > 1:
-            start_anchor_i = lo - 2  # include the segment leading into the first selected anchor
-        end_anchor_i = hi - 1
-        start_global = tr_indices[start_anchor_i]
-        end_global = tr_indices[end_anchor_i]
-        if start_global > end_global:
-            start_global, end_global = end_global, start_global
-        for j in range(start_global, end_global):
-            if j < 0 or j + 1 >= len(self._items):
-                break
-            try:
-                _k1, a, _h1 = self._items[j]
-                _k2, b, _h2 = self._items[j + 1]
-                if a is None or b is None:
-                    continue
-                line = QGraphicsLineItem(a.pos().x(), a.pos().y(), b.pos().x(), b.pos().y())
-                line.setPen(green_pen)
-                line.setZValue(25)
-                self.graphics_scene.addItem(line)
-                self._range_overlay_lines.append(line)
-            except Exception:
-                continue
+        self._draw_range_overlay_segments([idx for idx, _it in anchors], lo, hi)
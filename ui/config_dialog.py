@@ -15,6 +15,36 @@ from PySide6.QtWidgets import (
 from ui.qt_compat import Qt, QSizePolicy, QDialogButtonBox
 from ui.sidebar.widgets.no_wheel_spinbox import NoWheelDoubleSpinBox
 
+# One sheet for the whole dialog, so Qt parses it once and polishes the tree a single time
+_CONFIG_DIALOG_STYLE = """
+QDialog#configDialog { background-color: #151515; }
+QLabel { color: #f0f0f0; }
+QWidget#configTitleBar {
+    background-color: #2a2a2a;
+    border: 1px solid #5a5a5a;
+    border-radius: 6px;
+}
+QLabel#configTitle {
+    font-size: 14px;
+    font-weight: bold;
+    color: #eeeeee;
+    background: transparent;
+    border: none;
+    padding: 6px 0;
+}
+QGroupBox#configForm { background-color: #202020; border: 1px solid #444444; border-radius: 6px; }
+QWidget[constraintRow='true'] { background: #2d2d2d; border: 1px solid #454545; border-radius: 6px; margin: 4px 0; }
+QDialogButtonBox QPushButton {
+    background-color: #303030;
+    color: #eeeeee;
+    border: 1px solid #5a5a5a;
+    border-radius: 4px;
+    padding: 4px 10px;
+}
+QDialogButtonBox QPushButton:hover { background: #575757; }
+QDialogButtonBox QPushButton:pressed { background: #6a6a6a; }
+"""
+
 
 class ConfigDialog(QDialog):
     """Dialog to edit config.json values.
@@ -35,17 +65,8 @@ class ConfigDialog(QDialog):
         cfg = existing_config or {}
         self._on_change = on_change
 
-        # Apply dark dialog background to match the app
-        try:
-            self.setObjectName("configDialog")
-            self.setStyleSheet(
-                """
-                QDialog#configDialog { background-color: #151515; }
-                QLabel { color: #f0f0f0; }
-                """
-            )
-        except Exception:
-            pass
+        # Dark dialog styling to match the app; the sheet is applied once at the end
+        self.setObjectName("configDialog")
 
         root = QVBoxLayout(self)
         try:
@@ -57,18 +78,6 @@ class ConfigDialog(QDialog):
         # Title bar styled like other sections in the app
         self.title_bar = QWidget()
         self.title_bar.setObjectName("configTitleBar")
-        try:
-            self.title_bar.setStyleSheet(
-                """
-                QWidget#configTitleBar {
-                    background-color: #2a2a2a;
-                    border: 1px solid #5a5a5a;
-                    border-radius: 6px;
-                }
-                """
-            )
-        except Exception:
-            pass
         title_layout = QHBoxLayout(self.title_bar)
         try:
             title_layout.setContentsMargins(10, 0, 10, 0)
@@ -76,35 +85,14 @@ class ConfigDialog(QDialog):
         except Exception:
             pass
         title_label = QLabel("Configuration")
-        try:
-            title_label.setStyleSheet(
-                """
-                font-size: 14px;
-                font-weight: bold;
-                color: #eeeeee;
-                background: transparent;
-                border: none;
-                padding: 6px 0;
-                """
-            )
-        except Exception:
-            pass
+        title_label.setObjectName("configTitle")
         title_layout.addWidget(title_label)
         title_layout.addStretch()
         root.addWidget(self.title_bar)
 
         # Group box container matching sidebar look
         self.form_container = QGroupBox()
-        try:
-            self.form_container.setStyleSheet(
-                """
-                QGroupBox { background-color: #202020; border: 1px solid #444444; border-radius: 6px; }
-                QLabel { color: #f0f0f0; }
-                QWidget[constraintRow='true'] { background: #2d2d2d; border: 1px solid #454545; border-radius: 6px; margin: 4px 0; }
-                """
-            )
-        except Exception:
-            pass
+        self.form_container.setObjectName("configForm")
         group_layout = QVBoxLayout(self.form_container)
         try:
             group_layout.setContentsMargins(8, 6, 8, 6)
@@ -133,7 +121,8 @@ class ConfigDialog(QDialog):
             except Exception:
                 pass
 
-            spin = NoWheelDoubleSpinBox(self)
+            # Parent to the row it lives in so adding it to the row layout is not a reparent
+            spin = NoWheelDoubleSpinBox(row)
             spin.setDecimals(4)
             spin.setSingleStep(step)
             spin.setRange(rng[0], rng[1])
@@ -226,26 +215,12 @@ class ConfigDialog(QDialog):
         buttons = QDialogButtonBox(
             QDialogButtonBox.Ok | QDialogButtonBox.Cancel, orientation=Qt.Horizontal, parent=self
         )
-        try:
-            buttons.setStyleSheet(
-                """
-                QDialogButtonBox QPushButton {
-                    background-color: #303030;
-                    color: #eeeeee;
-                    border: 1px solid #5a5a5a;
-                    border-radius: 4px;
-                    padding: 4px 10px;
-                }
-                QDialogButtonBox QPushButton:hover { background: #575757; }
-                QDialogButtonBox QPushButton:pressed { background: #6a6a6a; }
-                """
-            )
-        except Exception:
-            pass
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         root.addWidget(buttons)
 
+        self.setStyleSheet(_CONFIG_DIALOG_STYLE)
+
     def get_values(self) -> Dict[str, float]:
         result: Dict[str, float] = {}
         for k, spin in self._spins.items():
@@ -261,12 +236,21 @@ class ConfigDialog(QDialog):
 
     def sync_from_config(self, cfg: Dict[str, float]) -> None:
         """Update spinner values from the provided config without emitting signals."""
-        for key, spin in self._spins.items():
-            try:
-                spin.blockSignals(True)
-                if key in cfg and cfg[key] is not None:
-                    spin.setValue(float(cfg[key]))
-            except Exception:
-                pass
-            finally:
+        spins = self._spins
+        for spin in spins.values():
+            spin.blockSignals(True)
+        try:
+            for key, spin in spins.items():
+                value = cfg.get(key)
+                if value is None:
+                    continue
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    continue
+                # Leave spinners that already show the value alone
+                if abs(spin.value() - value) > 1e-9:
+                    spin.setValue(value)
+        finally:
+            for spin in spins.values():
                 spin.blockSignals(False)
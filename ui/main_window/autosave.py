@@ -13,6 +13,56 @@ if TYPE_CHECKING:
     from ui.sidebar.sidebar import Sidebar
     from ui.canvas.view import CanvasView
 
+# Status label styles, built once so each state change reuses the same string
+_SAVING_QSS = """
+    QLabel {
+        background-color: #3a2a1a;
+        color: #d4a76a;
+        border: 1px solid #c47a2d;
+        border-radius: 4px;
+        padding: 2px 6px;
+        font-size: 10px;
+        font-weight: 500;
+        margin-right: 5px;
+    }
+"""
+_ERROR_QSS = """
+    QLabel {
+        background-color: #3a1a1a;
+        color: #c66b6b;
+        border: 1px solid #b33d3d;
+        border-radius: 4px;
+        padding: 2px 6px;
+        font-size: 10px;
+        font-weight: 500;
+        margin-right: 5px;
+    }
+"""
+_SUCCESS_QSS = """
+    QLabel {
+        background-color: #1a3a1a;
+        color: #7fb97f;
+        border: 1px solid #5fa85f;
+        border-radius: 4px;
+        padding: 2px 6px;
+        font-size: 10px;
+        font-weight: 500;
+        margin-right: 5px;
+    }
+"""
+_SAVED_QSS = """
+    QLabel {
+        background-color: #2a2a2a;
+        color: #7fb97f;
+        border: 1px solid #5fa85f;
+        border-radius: 4px;
+        padding: 2px 6px;
+        font-size: 10px;
+        font-weight: 500;
+        margin-right: 5px;
+    }
+"""
+
 
 class AutosaveController:
     """Encapsulates autosave timers, indicators, and feedback messaging."""
@@ -27,7 +77,9 @@ class AutosaveController:
         self.status_label = QLabel("Saved")
         self.status_label.setFixedSize(85, 20)
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet(self._saved_style())
+        self._current_style = None
+        self._indicator_shown = False
+        self._set_status_style(_SAVED_QSS)
 
         status_bar = window.statusBar
         status_bar.addPermanentWidget(self.status_label, stretch=0)
@@ -45,7 +97,9 @@ class AutosaveController:
     def schedule(self) -> None:
         """Debounce save events and show the busy indicator."""
         self.timer.start()
-        self._show_indicator()
+        # Bursts of edits restart the debounce; the indicator only needs showing once
+        if not self._indicator_shown:
+            self._show_indicator()
 
     def _perform_autosave(self) -> None:
         project_manager = self.window.project_manager
@@ -68,8 +122,9 @@ class AutosaveController:
 
     def _show_indicator(self) -> None:
         self.status_label.setText("💾 Saving...")
-        self.status_label.setStyleSheet(self._saving_style())
+        self._set_status_style(_SAVING_QSS)
         self.status_label.setAlignment(Qt.AlignCenter)
+        self._indicator_shown = True
 
     def _hide_indicator(self) -> None:
         self._reset_timer.stop()
@@ -78,80 +133,28 @@ class AutosaveController:
     def _show_feedback(self, message: str, error: bool = False) -> None:
         if error:
             self.status_label.setText("❌ Error")
-            self.status_label.setStyleSheet(self._error_style())
+            self._set_status_style(_ERROR_QSS)
             self.status_label.setAlignment(Qt.AlignCenter)
             self._reset_timer.start(2000)
         else:
             self.status_label.setText("✅ Saved")
-            self.status_label.setStyleSheet(self._success_style())
+            self._set_status_style(_SUCCESS_QSS)
             self.status_label.setAlignment(Qt.AlignCenter)
             self._reset_timer.start(1500)
 
     def _reset_status(self) -> None:
+        self._indicator_shown = False
         try:
             self.status_label.setText("Saved")
-            self.status_label.setStyleSheet(self._saved_style())
+            self._set_status_style(_SAVED_QSS)
             self.status_label.setAlignment(Qt.AlignCenter)
         except RuntimeError:
             # The status label can be deleted during shutdown; ignore late updates.
             pass
 
-    @staticmethod
-    def _saving_style() -> str:
-        return """
-            QLabel {
-                background-color: #3a2a1a;
-                color: #d4a76a;
-                border: 1px solid #c47a2d;
-                border-radius: 4px;
-                padding: 2px 6px;
-                font-size: 10px;
-                font-weight: 500;
-                margin-right: 5px;
-            }
-        """
-
-    @staticmethod
-    def _error_style() -> str:
-        return """
-            QLabel {
-                background-color: #3a1a1a;
-                color: #c66b6b;
-                border: 1px solid #b33d3d;
-                border-radius: 4px;
-                padding: 2px 6px;
-                font-size: 10px;
-                font-weight: 500;
-                margin-right: 5px;
-            }
-        """
-
-    @staticmethod
-    def _success_style() -> str:
-        return """
-            QLabel {
-                background-color: #1a3a1a;
-                color: #7fb97f;
-                border: 1px solid #5fa85f;
-                border-radius: 4px;
-                padding: 2px 6px;
-                font-size: 10px;
-                font-weight: 500;
-                margin-right: 5px;
-            }
-        """
-
-    @staticmethod
-    def _saved_style() -> str:
-        return """
-            QLabel {
-                background-color: #2a2a2a;
-                color: #7fb97f;
-                border: 1px solid #5fa85f;
-                border-radius: 4px;
-                padding: 2px 6px;
-                font-size: 10px;
-                font-weight: 500;
-                margin-right: 5px;
-            }
-        """
+    def _set_status_style(self, style: str) -> None:
+        # Setting a stylesheet re-parses it and re-polishes the label, so skip repeats
+        if style is self._current_style:
+            return
+        self.status_label.setStyleSheet(style)
+        self._current_style = style
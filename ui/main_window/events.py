@@ -6,65 +6,51 @@ from typing import TYPE_CHECKING
 from PySide6.QtCore import QEvent, QTimer
 from PySide6.QtWidgets import QWidget
 
+from ui.qt_compat import Qt
+
 if TYPE_CHECKING:
     from ui.main_window.window import MainWindow
 
+# Window state bits that change the layout; activation-only flips are ignored
+_LAYOUT_STATE_MASK = Qt.WindowMinimized | Qt.WindowMaximized | Qt.WindowFullScreen
+
 
 class WindowEventMixin:
     def changeEvent(self: "MainWindow", event):
         if event.type() == QEvent.WindowStateChange:
-            self._layout_stabilizing = True
-            try:
-                self.sidebar.set_suspended(True)
-            except Exception:
-                pass
-
-            def _clear():
-                setattr(self, "_layout_stabilizing", False)
+            timer = getattr(self, "_layout_stabilize_timer", None)
+            if timer is not None and (event.oldState() ^ self.windowState()) & _LAYOUT_STATE_MASK:
+                self._layout_stabilizing = True
                 try:
-                    self.sidebar.set_suspended(False)
+                    self.sidebar.set_suspended(True)
                 except Exception:
                     pass
-
-            QTimer.singleShot(1000, _clear)
+                # Restarting the timer folds back-to-back state changes into one clear
+                timer.start()
         super().changeEvent(event)
 
+    def _end_layout_stabilizing(self: "MainWindow"):
+        self._layout_stabilizing = False
+        try:
+            self.sidebar.set_suspended(False)
+        except Exception:
+            pass
+
     def eventFilter(self: "MainWindow", obj, event):
         try:
             if event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick):
                 target_widget = obj if isinstance(obj, QWidget) else None
 
                 def _belongs_to_range_controls(widget: QWidget) -> bool:
-                    try:
-                        if widget is None:
-                            return False
-                        if (
-                            hasattr(self.sidebar, "points_list")
-                            and self.sidebar.points_list is not None
-                        ):
-                            pl = self.sidebar.points_list
-                            curr = widget
-                            steps = 0
-                            max_steps = 100
-                            while curr is not None and steps < max_steps:
-                                if curr is pl:
-                                    return False
-                                curr = curr.parent() if hasattr(curr, "parent") else None
-                                steps += 1
-                        if hasattr(self.sidebar, "is_widget_range_related") and callable(
-                            self.sidebar.is_widget_range_related
-                        ):
-                            curr = widget
-                            steps = 0
-                            max_steps = 100
-                            while curr is not None and steps < max_steps:
-                                if self.sidebar.is_widget_range_related(curr):
-                                    return True
-                                curr = curr.parent() if hasattr(curr, "parent") else None
-                                steps += 1
-                    except Exception:
+                    # isAncestorOf walks the parent chain in C++, so each check is a single call
+                    if widget is None:
+                        return False
+                    pl = getattr(self.sidebar, "points_list", None)
+                    if pl is not None and (pl is widget or pl.isAncestorOf(widget)):
                         return False
-                    return False
+                    # The sidebar matches the widget and every ancestor of it against the
+                    # range controls via isAncestorOf, so no walk up the tree is needed here
+                    return bool(self.sidebar.is_widget_range_related(widget))
 
                 if not _belongs_to_range_controls(target_widget):
                     try:
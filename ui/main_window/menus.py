@@ -1,6 +1,7 @@
 # mypy: ignore-errors
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QPoint
@@ -119,18 +120,20 @@ def build_menu_bar(window: "MainWindow") -> None:
     path_menu.addAction(window.action_delete_path)
 
     edit_menu: QMenu = bar.addMenu("Edit")
-    window.action_undo = QAction(_create_arrow_icon("undo", 12), "Undo", window)
+    # Icons are painted the first time the menu opens; the shortcuts work without them
+    window.action_undo = QAction("Undo", window)
     window.action_undo.setShortcut(QKeySequence.Undo)
     window.action_undo.triggered.connect(window._action_undo)
     window.action_undo.setEnabled(False)
     edit_menu.addAction(window.action_undo)
     edit_menu.addSeparator()
 
-    window.action_redo = QAction(_create_arrow_icon("redo", 12), "Redo", window)
+    window.action_redo = QAction("Redo", window)
     window.action_redo.setShortcut(QKeySequence.Redo)
     window.action_redo.triggered.connect(window._action_redo)
     window.action_redo.setEnabled(False)
     edit_menu.addAction(window.action_redo)
+    edit_menu.aboutToShow.connect(lambda: _ensure_edit_icons(window))
 
     settings_menu: QMenu = bar.addMenu("Settings")
     window.action_edit_config = QAction("Edit Config…", window)
@@ -151,7 +154,15 @@ def build_menu_bar(window: "MainWindow") -> None:
     window.update()
 
 
+def _ensure_edit_icons(window: "MainWindow") -> None:
+    if window.action_undo.icon().isNull():
+        window.action_undo.setIcon(_create_arrow_icon("undo", 12))
+        window.action_redo.setIcon(_create_arrow_icon("redo", 12))
+
+
+@lru_cache(maxsize=None)
 def _create_arrow_icon(direction: str, size: int = 16) -> QIcon:
+    # Icons are implicitly shared, so every menu can reuse the one painted here
     try:
         pixmap = QPixmap(size, size)
         pixmap.fill(Qt.transparent)
@@ -145,6 +145,7 @@ class MainWindow(WindowEventMixin, QMainWindow):
 
         # Canvas interactions -> update model and sidebar
         self.canvas.elementMoved.connect(self._on_canvas_element_moved, Qt.QueuedConnection)
+        self.canvas.elementsMoved.connect(self._on_canvas_elements_moved, Qt.QueuedConnection)
         self.canvas.elementRotated.connect(self._on_canvas_element_rotated, Qt.QueuedConnection)
         # Handle start and end of drags for undo/redo
         self.canvas.elementSelected.connect(self._on_canvas_element_pressed, Qt.QueuedConnection)
@@ -175,6 +176,10 @@ class MainWindow(WindowEventMixin, QMainWindow):
 
         # Stabilization flag for fullscreen/window state transitions
         self._layout_stabilizing: bool = False
+        self._layout_stabilize_timer = QTimer(self)
+        self._layout_stabilize_timer.setSingleShot(True)
+        self._layout_stabilize_timer.setInterval(1000)
+        self._layout_stabilize_timer.timeout.connect(self._end_layout_stabilizing)
         # Track config-edit undo session state
         self._config_undo_recorded: bool = False
         self._config_edit_old_config: dict | None = None
@@ -1048,8 +1053,24 @@ class MainWindow(WindowEventMixin, QMainWindow):
         # Suppress during window state transitions to avoid re-entrant churn
         if getattr(self, "_layout_stabilizing", False):
             return
-        if index < 0 or index >= len(self.path.path_elements):
+        if self._apply_canvas_move(index, x_m, y_m):
+            self.sidebar.update_current_values_only()
+        # defer autosave until drag finished; handled by elementDragFinished
+
+    def _on_canvas_elements_moved(self, indices: list, xs: list, ys: list):
+        """Apply a batch of canvas moves, refreshing the sidebar once for the whole batch."""
+        if getattr(self, "_layout_stabilizing", False):
             return
+        moved = False
+        for index, x_m, y_m in zip(indices, xs, ys):
+            moved = self._apply_canvas_move(index, x_m, y_m) or moved
+        if moved:
+            self.sidebar.update_current_values_only()
+
+    def _apply_canvas_move(self, index: int, x_m: float, y_m: float) -> bool:
+        """Write a canvas position for element ``index`` into the model; False if out of range."""
+        if index < 0 or index >= len(self.path.path_elements):
+            return False
 
         # Clamp via sidebar metadata to keep UI and model consistent
         x_m = clamp_from_metadata("x_meters", float(x_m))
@@ -1096,8 +1117,7 @@ class MainWindow(WindowEventMixin, QMainWindow):
             elem.translation_target.y_meters = y_m
             # Waypoint rotation position is ratio-based; do not force x/y here
 
-        self.sidebar.update_current_values_only()
-        # defer autosave until drag finished; handled by elementDragFinished
+        return True
 
     def _on_canvas_element_rotated(self, index: int, radians: float):
         # Suppress during window state transitions to avoid re-entrant churn